@@ -2,12 +2,19 @@
 Feature extraction module for analyzing audio and extracting musical features.
 """
 
+import contextlib
 import numpy as np
 import librosa
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
 class NoteName(Enum):
     C = 0
     C_SHARP = 1
@@ -52,22 +59,34 @@ class FeatureExtractor:
         Returns:
             Dictionary containing extracted features
         """
+        # float32, contiguous: a float64 or strided input would otherwise be
+        # carried through every FFT and filter at twice the memory traffic
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
         features = {}
         
+        # One STFT shared by the spectral and harmonic features
+        D = librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length)
+        S = np.abs(D)
+        
         # Basic features
         features.update(FeatureExtractor._extract_basic_features(audio_data, sample_rate))
         
-        # Spectral features
-        features.update(FeatureExtractor._extract_spectral_features(
-            audio_data, sample_rate, hop_length, n_fft))
-            
-        # Rhythmic features
-        features.update(FeatureExtractor._extract_rhythmic_features(
-            audio_data, sample_rate, hop_length))
-            
-        # Harmonic features
-        features.update(FeatureExtractor._extract_harmonic_features(
-            audio_data, sample_rate))
+        # Spectral, rhythmic and harmonic features are independent and spend
+        # their time in numpy/scipy calls that release the GIL, so overlap them.
+        # BLAS/OpenMP pools are capped at one thread so the three tasks do not
+        # oversubscribe the cores.
+        limits = (threadpool_limits(limits=1) if threadpool_limits is not None
+                  else contextlib.nullcontext())
+        with limits, ThreadPoolExecutor(max_workers=3) as pool:
+            spectral = pool.submit(FeatureExtractor._extract_spectral_features,
+                                   audio_data, sample_rate, hop_length, n_fft, S=S)
+            rhythmic = pool.submit(FeatureExtractor._extract_rhythmic_features,
+                                   audio_data, sample_rate, hop_length)
+            harmonic = pool.submit(FeatureExtractor._extract_harmonic_features,
+                                   audio_data, sample_rate, hop_length, n_fft, D=D, S=S)
+            features.update(spectral.result())
+            features.update(rhythmic.result())
+            features.update(harmonic.result())
             
         return features
     
@@ -87,32 +106,42 @@ class FeatureExtractor:
     def _extract_spectral_features(audio_data: np.ndarray,
                                  sample_rate: int,
                                  hop_length: int,
-                                 n_fft: int) -> Dict[str, Any]:
+                                 n_fft: int,
+                                 S: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Extract spectral features."""
-        # Compute spectrogram
-        S = np.abs(librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length))
+        # One magnitude spectrogram feeds every spectral feature below
+        if S is None:
+            S = np.abs(librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length))
         
         # Spectral centroid and bandwidth
         spectral_centroid = librosa.feature.spectral_centroid(
-            y=audio_data, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
+            S=S, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
         spectral_bandwidth = librosa.feature.spectral_bandwidth(
-            y=audio_data, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
+            S=S, sr=sample_rate, n_fft=n_fft, hop_length=hop_length,
+            centroid=spectral_centroid)
         
         # Spectral contrast
         spectral_contrast = librosa.feature.spectral_contrast(
-            y=audio_data, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
+            S=S, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
         
-        # MFCCs
-        mfcc = librosa.feature.mfcc(
-            y=audio_data, sr=sample_rate, n_mfcc=20, n_fft=n_fft, hop_length=hop_length)
+        # Spectral rolloff
+        spectral_rolloff = librosa.feature.spectral_rolloff(
+            S=S, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)
+        
+        # MFCCs (from the power mel spectrogram of the same STFT)
+        mel = librosa.feature.melspectrogram(S=S**2, sr=sample_rate, n_fft=n_fft)
+        mfcc = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=20)
+        
+        # The per-frame scalar features share a frame grid: one reduction
+        centroid_mean, bandwidth_mean, rolloff_mean = np.concatenate(
+            [spectral_centroid, spectral_bandwidth, spectral_rolloff]).mean(axis=1)
         
         return {
-            'spectral_centroid': np.mean(spectral_centroid[0]),
-            'spectral_bandwidth': np.mean(spectral_bandwidth[0]),
-            'spectral_contrast': np.mean(spectral_contrast, axis=1).tolist(),
-            'mfcc': np.mean(mfcc, axis=1).tolist(),
-            'spectral_rolloff': np.mean(librosa.feature.spectral_rolloff(
-                y=audio_data, sr=sample_rate, n_fft=n_fft, hop_length=hop_length)[0])
+            'spectral_centroid': centroid_mean,
+            'spectral_bandwidth': bandwidth_mean,
+            'spectral_contrast': spectral_contrast.mean(axis=1).tolist(),
+            'mfcc': mfcc.mean(axis=1).tolist(),
+            'spectral_rolloff': rolloff_mean
         }
     
     @staticmethod
@@ -120,16 +149,16 @@ class FeatureExtractor:
                                  sample_rate: int,
                                  hop_length: int) -> Dict[str, Any]:
         """Extract rhythmic features like tempo and beat information."""
-        # Estimate tempo and beat frames
-        tempo, beat_frames = librosa.beat.beat_track(
-            y=audio_data, sr=sample_rate, hop_length=hop_length)
-        
         # Get onset envelope
         onset_env = librosa.onset.onset_strength(
             y=audio_data, sr=sample_rate, hop_length=hop_length)
         
-        # Get onset times
-        onset_times = librosa.times_like(onset_env, sr=sample_rate, hop_length=hop_length)
+        # Estimate tempo and beat frames from the same envelope
+        tempo, beat_frames = librosa.beat.beat_track(
+            onset_envelope=onset_env, sr=sample_rate, hop_length=hop_length)
+        
+        # Get onset times (frame index * hop / sr, as librosa.times_like)
+        onset_times = np.arange(len(onset_env)) * hop_length / sample_rate
         
         beat_times = librosa.frames_to_time(beat_frames, sr=sample_rate, hop_length=hop_length)
         # Robust scalar coercion for numpy 2.x / librosa 0.11 returns
@@ -148,35 +177,53 @@ class FeatureExtractor:
     
     @staticmethod
     def _extract_harmonic_features(audio_data: np.ndarray,
-                                 sample_rate: int) -> Dict[str, Any]:
+                                 sample_rate: int,
+                                 hop_length: int = 512,
+                                 n_fft: int = 2048,
+                                 D: Optional[np.ndarray] = None,
+                                 S: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Extract harmonic and pitch-related features."""
-        # Harmonic and percussive separation
-        y_harmonic, y_percussive = librosa.effects.hpss(audio_data)
+        if D is None:
+            D = librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length)
+        if S is None:
+            S = np.abs(D)
+        
+        # Harmonic and percussive separation on the STFT itself; nothing here
+        # needs the time-domain components, so skip the two inverse STFTs
+        H, P = librosa.decompose.hpss(D)
+        # Energies in the spectral domain (same ratio as time domain by Parseval)
+        harm_energy = float(np.vdot(H, H).real)
+        perc_energy = float(np.vdot(P, P).real)
         
         # Estimate tuning
-        tuning = librosa.estimate_tuning(y=audio_data, sr=sample_rate)
+        tuning = librosa.estimate_tuning(S=S, sr=sample_rate, n_fft=n_fft)
         
-        # Chroma features
-        chroma = librosa.feature.chroma_cqt(y=audio_data, sr=sample_rate)
+        # Chroma features from the shared STFT; a mean chroma vector for key
+        # picking does not need the constant-Q transform's resolution
+        chroma = librosa.feature.chroma_stft(
+            S=S**2, sr=sample_rate, n_fft=n_fft, hop_length=hop_length, tuning=tuning)
         
         # Estimate key and mode
-        key, mode = FeatureExtractor._estimate_key(audio_data, sample_rate)
+        key, mode = FeatureExtractor._estimate_key(audio_data, sample_rate, chroma=chroma)
         
         return {
-            'harmonic_ratio': np.mean(y_harmonic**2) / (np.mean(y_harmonic**2) + np.mean(y_percussive**2) + 1e-10),
+            'harmonic_ratio': harm_energy / (harm_energy + perc_energy + 1e-10),
             'tuning_offset': float(tuning),
             'chroma': np.mean(chroma, axis=1).tolist(),
             'key': key,
             'mode': mode,
             'pitch_centroid': float(np.mean(librosa.feature.spectral_centroid(
-                y=y_harmonic, sr=sample_rate)))
+                S=np.abs(H), sr=sample_rate, n_fft=n_fft, hop_length=hop_length)))
         }
     
     @staticmethod
-    def _estimate_key(audio_data: np.ndarray, sample_rate: int) -> Tuple[str, str]:
+    def _estimate_key(audio_data: np.ndarray,
+                      sample_rate: int,
+                      chroma: Optional[np.ndarray] = None) -> Tuple[str, str]:
         """Estimate the musical key and mode of the audio."""
         # Get chroma features
-        chroma = librosa.feature.chroma_cqt(y=audio_data, sr=sample_rate)
+        if chroma is None:
+            chroma = librosa.feature.chroma_cqt(y=audio_data, sr=sample_rate)
         
         # Get the most prominent chroma
         chroma_vals = np.mean(chroma, axis=1)
@@ -211,7 +258,7 @@ class FeatureExtractor:
         
         # Simple chord template matching (in a real implementation, this would be more sophisticated)
         chords = []
-        frame_times = librosa.times_like(chroma[0], sr=sample_rate, hop_length=hop_length)
+        frame_times = np.arange(chroma.shape[1]) * hop_length / sample_rate
         
         for i in range(chroma.shape[1]):
             # Find the most prominent chroma (simplified)
@@ -0,0 +1,76 @@
+import pytest
+from unittest.mock import patch
+
+from toolshop.audio_io import iter_audio_blocks, load_audio
+
+
+def test_load_audio_downmixes_and_resamples(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    pytest.importorskip("scipy")
+
+    test_file = tmp_path / "stereo.wav"
+    sf.write(str(test_file), np.zeros((44100, 2), dtype=np.float32), 44100)
+
+    y, sr = load_audio(test_file)
+
+    assert sr == 22050
+    assert y.ndim == 1
+    assert y.dtype == np.float32
+    assert len(y) == 22050
+
+
+def test_iter_audio_blocks_covers_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+
+    test_file = tmp_path / "mono.wav"
+    sf.write(str(test_file), np.zeros(22050 * 3, dtype=np.float32), 22050)
+
+    blocks = list(iter_audio_blocks(test_file, block_seconds=1.0))
+
+    assert len(blocks) == 3
+    assert sum(len(b) for b in blocks) == 22050 * 3
+
+
+def test_load_audio_float64_file_returns_float32(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+
+    test_file = tmp_path / "double.wav"
+    sf.write(str(test_file), np.zeros(22050, dtype=np.float64), 22050, subtype="DOUBLE")
+
+    y, _ = load_audio(test_file)
+    blocks = list(iter_audio_blocks(test_file))
+
+    assert y.dtype == np.float32
+    assert all(b.dtype == np.float32 for b in blocks)
+
+
+def test_iter_audio_blocks_resamples_continuously(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    pytest.importorskip("scipy")
+
+    test_file = tmp_path / "noise.wav"
+    rng = np.random.default_rng(0)
+    sf.write(str(test_file), 0.1 * rng.standard_normal(44100 * 3), 44100, subtype="FLOAT")
+
+    y, _ = load_audio(test_file)
+    blocks = list(iter_audio_blocks(test_file, block_seconds=0.5))
+
+    assert len(blocks) > 1
+    np.testing.assert_array_equal(np.concatenate(blocks), y)
+
+
+def test_load_audio_without_librosa_fallback_raises(tmp_path):
+    pytest.importorskip("soundfile")
+
+    test_file = tmp_path / "broken.mp3"
+    test_file.write_bytes(b"not audio")
+
+    with patch("toolshop.audio_io.librosa", None):
+        with pytest.raises(RuntimeError, match="pip install librosa"):
+            load_audio(test_file)
+        with pytest.raises(RuntimeError, match="pip install librosa"):
+            list(iter_audio_blocks(test_file))
@@ -29,6 +29,16 @@ def test_discover_files(tmp_path):
     assert [p.name for p in files] == ["a.wav", "b.mp3", "c.flac"]
 
 
+def test_discover_files_matches_extension_case_insensitively(tmp_path):
+    (tmp_path / "deep" / "er").mkdir(parents=True)
+    (tmp_path / "deep" / "er" / "Loud.WAV").touch()
+    (tmp_path / "noext").touch()
+    (tmp_path / "archive.wav.bak").touch()
+
+    files = batch.discover_files(tmp_path, [".wav"])
+    assert [p.name for p in files] == ["Loud.WAV"]
+
+
 def test_discover_files_limit_and_offset(tmp_path):
     for i in range(5):
         (tmp_path / f"track{i:02d}.wav").touch()
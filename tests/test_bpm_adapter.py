@@ -2,29 +2,40 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from toolshop.bpm_adapter import _check_librosa, analyze_track, analyze_library
+from toolshop.bpm_adapter import (
+    _analyze_track_safe,
+    _cache_path,
+    _check_librosa,
+    _pipeline,
+    analyze_track,
+    analyze_track_bpm_only,
+    analyze_library,
+    chroma_from_power,
+    estimate_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLSHOP_DATA_DIR", str(tmp_path / "data"))
 
 
 @pytest.fixture
 def mock_librosa():
     with patch("toolshop.bpm_adapter.librosa") as mock_lib, patch(
         "toolshop.bpm_adapter.np"
-    ) as mock_np:
+    ) as mock_np, patch(
+        "toolshop.bpm_adapter.load_audio", return_value=(MagicMock(), 22050)
+    ), patch(
+        # numpy is mocked, so stub the key estimate itself
+        "toolshop.bpm_adapter.estimate_key",
+        return_value=("C", "major"),
+    ):
         # Setup basic librosa mock returns
         mock_lib.load.return_value = (MagicMock(), 22050)
         mock_lib.get_duration.return_value = 120.5
         mock_lib.beat.beat_track.return_value = (120.0, None)
 
-        # Setup chroma feature mock
-        mock_chroma = MagicMock()
-        mock_lib.feature.chroma_cqt.return_value = mock_chroma
-
-        # Mock numpy mean and argmax
-        mock_np.mean.return_value = [
-            0.8
-        ] * 12  # Return array of floats > 0.5 for major mode
-        mock_np.argmax.return_value = 0
-
         # np.atleast_1d must return something indexable that float() can convert
         mock_np.atleast_1d.return_value = [120.0]
 
@@ -74,7 +85,7 @@ def test_analyze_library(mock_librosa, tmp_path):
     file2.touch()
 
     with patch("toolshop.bpm_adapter._HAS_LIBROSA", True):
-        results = analyze_library(tmp_path)
+        results = analyze_library(tmp_path, workers=1)
 
     assert len(results) == 2
 
@@ -83,3 +94,166 @@ def test_analyze_library(mock_librosa, tmp_path):
     assert str(file1) in files_analyzed
     assert str(file2) in files_analyzed
     assert results[0]["bpm"] == 120.0
+
+
+def test_analyze_track_safe_returns_error_record():
+    missing = Path("nonexistent_file.wav")
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True):
+        result = _analyze_track_safe(missing)
+
+    assert result["file"] == str(missing)
+    assert "error" in result
+
+
+def test_analyze_library_reuses_cache(tmp_path):
+    audio = tmp_path / "song.wav"
+    audio.write_bytes(b"RIFF")
+    fake = {"file": str(audio), "bpm": 100.0, "key": "D", "mode": "minor"}
+
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True), patch(
+        "toolshop.bpm_adapter.analyze_track", return_value=fake
+    ) as mock_analyze:
+        first = analyze_library(tmp_path, workers=1)
+        second = analyze_library(tmp_path, workers=1)
+
+    assert first == second == [fake]
+    assert mock_analyze.call_count == 1
+    assert _cache_path(tmp_path).exists()
+    assert _cache_path(tmp_path).is_relative_to(tmp_path / "data")
+    assert not (tmp_path / ".toolshop_cache.json").exists()
+
+
+def test_analyze_library_reanalyzes_changed_file(tmp_path):
+    audio = tmp_path / "song.wav"
+    audio.write_bytes(b"RIFF")
+    fake = {"file": str(audio), "bpm": 100.0, "key": "D", "mode": "minor"}
+
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True), patch(
+        "toolshop.bpm_adapter.analyze_track", return_value=fake
+    ) as mock_analyze:
+        analyze_library(tmp_path, workers=1)
+        audio.write_bytes(b"RIFF-changed")
+        analyze_library(tmp_path, workers=1)
+
+    assert mock_analyze.call_count == 2
+
+
+def test_analyze_library_single_walk_filters_extensions(tmp_path):
+    (tmp_path / "a.wav").touch()
+    (tmp_path / "b.FLAC").touch()
+    (tmp_path / "notes.txt").touch()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.mp3").touch()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "d.wav").touch()
+
+    def fake_analyze(path):
+        return {"file": str(path), "bpm": 1.0, "key": "C", "mode": "major"}
+
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True), patch(
+        "toolshop.bpm_adapter.analyze_track", side_effect=fake_analyze
+    ):
+        results = analyze_library(
+            tmp_path, extensions=["wav", ".flac", "mp3"], workers=1, use_cache=False
+        )
+
+    names = sorted(Path(r["file"]).name for r in results)
+    assert names == ["a.wav", "b.FLAC", "c.mp3"]
+
+
+def test_analyze_track_bpm_only(mock_librosa, tmp_path):
+    mock_lib, _ = mock_librosa
+    test_file = tmp_path / "test.wav"
+    test_file.touch()
+
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True):
+        result = analyze_track_bpm_only(test_file)
+
+    assert result["bpm"] == 120.0
+    assert "key" not in result
+    mock_lib.beat.beat_track.assert_not_called()
+    mock_lib.feature.chroma_stft.assert_not_called()
+
+
+def test_analyze_library_streams_ndjson(tmp_path):
+    import json
+
+    (tmp_path / "a.wav").touch()
+    (tmp_path / "b.wav").touch()
+    out = tmp_path / "out" / "results.ndjson"
+
+    def fake_analyze(path):
+        return {"file": str(path), "bpm": 1.0, "key": "C", "mode": "major"}
+
+    with patch("toolshop.bpm_adapter._HAS_LIBROSA", True), patch(
+        "toolshop.bpm_adapter.analyze_track", side_effect=fake_analyze
+    ):
+        results = analyze_library(
+            tmp_path, output_json=out, workers=1, use_cache=False, return_results=False
+        )
+
+    assert results == []
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert sorted(Path(json.loads(line)["file"]).name for line in lines) == ["a.wav", "b.wav"]
+
+
+@pytest.mark.parametrize(
+    "profile_name, shift, expected",
+    [("_MAJOR_PROFILE", 2, ("D", "major")), ("_MINOR_PROFILE", 9, ("A", "minor"))],
+)
+def test_estimate_key_matches_rotated_profiles(profile_name, shift, expected):
+    np = pytest.importorskip("numpy")
+    from toolshop import bpm_adapter
+
+    chroma_mean = np.roll(np.array(getattr(bpm_adapter, profile_name)), shift)
+
+    assert estimate_key(chroma_mean) == expected
+
+
+def test_chroma_from_power_matches_chroma_stft():
+    np = pytest.importorskip("numpy")
+    librosa = pytest.importorskip("librosa")
+
+    sr = 22050
+    t = np.arange(sr * 2) / sr
+    y = (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32)
+    S_power = np.abs(librosa.stft(y)) ** 2
+
+    chroma, tuning = chroma_from_power(S_power, sr)
+    expected = librosa.feature.chroma_stft(S=S_power, sr=sr, tuning=tuning)
+
+    assert np.allclose(chroma, expected, atol=1e-6)
+
+
+def test_pipeline_yields_in_order_with_bounded_decode(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = [tmp_path / f"{i}.wav" for i in range(10)]
+    loaded = []
+
+    def fake_load(path):
+        loaded.append(path)
+        return path, ("y", 22050)
+
+    def fake_analyze(item):
+        return {"file": str(item[0])}
+
+    with patch("toolshop.bpm_adapter._load_safe", side_effect=fake_load), patch(
+        "toolshop.bpm_adapter._analyze_loaded_safe", side_effect=fake_analyze
+    ), ThreadPoolExecutor(2) as io_pool, ThreadPoolExecutor(2) as compute_pool:
+        stream = _pipeline(paths, io_pool, compute_pool, depth=2)
+        first = next(stream)
+        assert len(loaded) <= 5
+        results = [first] + list(stream)
+
+    assert [r["file"] for r in results] == [str(p) for p in paths]
+
+
+def test_analyze_library_cli_defaults_to_one_worker(tmp_path):
+    from toolshop import cli
+
+    with patch("toolshop.bpm_adapter.analyze_library") as mock_library:
+        cli.main(["analyze", "library", str(tmp_path)])
+        assert mock_library.call_args.kwargs["workers"] == 1
+        cli.main(["analyze", "library", str(tmp_path), "--workers", "0"])
+        assert mock_library.call_args.kwargs["workers"] is None
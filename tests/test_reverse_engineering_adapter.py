@@ -55,7 +55,9 @@ def test_analyze_track_fallback_when_advanced_unavailable(mock_basic, tmp_path):
     test_file.touch()
     result = reverse_engineering_adapter.analyze_track(test_file)
     assert result["analysis_backend"] == "basic_librosa"
-    mock_basic.assert_called_once_with(test_file)
+    mock_basic.assert_called_once_with(
+        test_file, duration=None, target_sr=22050, precise_key=False
+    )
 
 
 @patch("toolshop.reverse_engineering_adapter.AudioProcessor")
@@ -67,7 +69,9 @@ def test_analyze_track_basic_backend(mock_feature_extractor, mock_audio_processo
         test_file.touch()
         result = reverse_engineering_adapter.analyze_track(test_file, backend="basic")
         assert result["analysis_backend"] == "basic_librosa"
-        mock_basic.assert_called_once_with(test_file)
+        mock_basic.assert_called_once_with(
+            test_file, duration=None, target_sr=22050, precise_key=False
+        )
         mock_audio_processor.load_audio.assert_not_called()
 
 
@@ -238,3 +242,76 @@ def test_analyze_track_export_json(mock_feature_extractor, mock_audio_processor,
         data = json.load(f)
     assert data["file"] == str(test_file)
     assert data["analysis_backend"] == "wav_reverse_engineer"
+
+
+def test_basic_analysis_caps_duration(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    pytest.importorskip("librosa")
+
+    sr = 22050
+    t = np.arange(sr * 3) / sr
+    test_file = tmp_path / "tone.wav"
+    sf.write(str(test_file), 0.5 * np.sin(2 * np.pi * 440.0 * t), sr)
+
+    result = reverse_engineering_adapter.analyze_track(test_file, backend="basic", duration=1.0)
+
+    assert result["duration_seconds"] == pytest.approx(3.0, abs=0.05)
+    assert result["analyzed_seconds"] == pytest.approx(1.0, abs=0.05)
+
+
+def test_basic_analysis_streams_blocks(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    pytest.importorskip("librosa")
+
+    sr = 22050
+    t = np.arange(sr * 3) / sr
+    test_file = tmp_path / "tone.wav"
+    sf.write(str(test_file), 0.5 * np.sin(2 * np.pi * 440.0 * t), sr)
+
+    whole = reverse_engineering_adapter._basic_analysis(test_file)
+    blocked = reverse_engineering_adapter._basic_analysis(test_file, block_seconds=1.0)
+
+    assert blocked["duration_seconds"] == whole["duration_seconds"] == pytest.approx(3.0)
+    assert blocked["key"] == whole["key"] == "A"
+    assert blocked["spectral_centroid"] == pytest.approx(whole["spectral_centroid"], rel=0.05)
+
+
+def test_analyze_track_precise_key_uses_cqt_chroma(tmp_path):
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    librosa = pytest.importorskip("librosa")
+
+    sr = 22050
+    t = np.arange(sr * 3) / sr
+    test_file = tmp_path / "tone.wav"
+    sf.write(str(test_file), 0.5 * np.sin(2 * np.pi * 440.0 * t), sr)
+
+    with patch.object(
+        librosa.feature, "chroma_cqt", wraps=librosa.feature.chroma_cqt
+    ) as mock_cqt:
+        result = reverse_engineering_adapter.analyze_track(
+            test_file, backend="basic", precise_key=True
+        )
+
+    assert mock_cqt.called
+    assert result["key"] == "A"
+
+
+def test_analyze_tracks_keeps_order_and_reports_errors(tmp_path):
+    good = tmp_path / "a.wav"
+    good.touch()
+    missing = tmp_path / "missing.wav"
+    with patch(
+        "toolshop.reverse_engineering_adapter._basic_analysis",
+        return_value={"file": str(good), "analysis_backend": "basic_librosa"},
+    ) as mock_basic:
+        results = reverse_engineering_adapter.analyze_tracks(
+            [good, missing], backend="basic", duration=30.0
+        )
+
+    assert results[0]["analysis_backend"] == "basic_librosa"
+    assert results[1]["file"] == str(missing)
+    assert "not found" in results[1]["error"]
+    mock_basic.assert_called_once_with(good, duration=30.0, target_sr=22050, precise_key=False)
@@ -3,7 +3,18 @@ from pathlib import Path
 from unittest.mock import patch, mock_open, MagicMock
 import json
 
-from toolshop.suno_adapter import sync_liked, list_library, export_text
+from toolshop.suno_adapter import (
+    _cache_path,
+    _parse_metadata,
+    export_text,
+    list_library,
+    sync_liked,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_data_dir(tmp_path_factory, monkeypatch):
+    monkeypatch.setenv("TOOLSHOP_DATA_DIR", str(tmp_path_factory.mktemp("data")))
 
 
 def test_sync_liked_placeholder():
@@ -148,3 +159,119 @@ def test_export_text_with_files(tmp_path, capsys):
     assert "pop, electronic" in txt_content
     assert "[LYRICS]" in txt_content
     assert "Test lyrics content" in txt_content
+
+
+def test_list_library_keeps_sorted_order(tmp_path, capsys):
+    """Test list_library output stays in path order when parsed concurrently"""
+    for i in range(40):
+        (tmp_path / f"clip{i:02d}_metadata.json").write_text(json.dumps({"id": f"clip{i:02d}"}))
+
+    list_library(tmp_path)
+    captured = capsys.readouterr()
+
+    ids = [line.split("\t")[0] for line in captured.out.strip().split("\n")]
+    assert ids == [f"clip{i:02d}" for i in range(40)]
+
+
+def test_list_library_reuses_metadata_cache(tmp_path, capsys):
+    """Test unchanged metadata files are served from the metadata cache"""
+    path = tmp_path / "clip1_metadata.json"
+    path.write_text(json.dumps({"id": "clip1", "title": "First"}))
+
+    list_library(tmp_path)
+    assert _cache_path(tmp_path).exists()
+    assert not (tmp_path / ".toolshop_suno_cache.json").exists()
+
+    with patch("toolshop.suno_adapter._load_one") as load_one:
+        list_library(tmp_path)
+        load_one.assert_not_called()
+    assert capsys.readouterr().out.count("First") == 2
+
+    path.write_text(json.dumps({"id": "clip1", "title": "Second title"}))
+    list_library(tmp_path)
+    assert "Second title" in capsys.readouterr().out
+
+
+def test_list_library_no_cache(tmp_path):
+    """Test use_cache=False neither reads nor writes the metadata cache"""
+    (tmp_path / "clip1_metadata.json").write_text(json.dumps({"id": "clip1"}))
+
+    list_library(tmp_path, use_cache=False)
+
+    assert not _cache_path(tmp_path).exists()
+
+
+def test_parse_metadata_keeps_only_used_fields():
+    """Test metadata parsing keeps just the fields the exports read"""
+    raw = json.dumps(
+        {
+            "id": "clip1",
+            "display_tags": ["pop"],
+            "audio_url": "https://example.com/clip1.mp3",
+            "metadata": {"prompt": "la la", "tags": "pop", "history": [1, 2, 3]},
+        }
+    ).encode("utf-8")
+
+    assert _parse_metadata(raw) == {
+        "id": "clip1",
+        "display_tags": ["pop"],
+        "metadata": {"prompt": "la la", "tags": "pop"},
+    }
+    assert _parse_metadata(b"[1, 2]") is None
+
+
+def test_export_text_skips_parsing_unliked(tmp_path, capsys):
+    """Test unliked files are pre-filtered but still fully listed later"""
+    (tmp_path / "liked_metadata.json").write_text(
+        json.dumps({"id": "liked", "title": "Keeper", "is_liked": True})
+    )
+    (tmp_path / "other_metadata.json").write_text(
+        json.dumps({"id": "other", "title": "Skipped", "is_liked": False})
+    )
+
+    with patch("toolshop.suno_adapter._parse_metadata", wraps=_parse_metadata) as parse:
+        export_text(tmp_path, tmp_path / "out" / "export.json")
+    assert parse.call_count == 1
+    assert json.loads((tmp_path / "out" / "export.json").read_text())["total_liked_songs"] == 1
+
+    capsys.readouterr()
+    list_library(tmp_path)
+    assert "Skipped" in capsys.readouterr().out
+
+
+def test_export_text_large_metadata_file(tmp_path):
+    """Test metadata files larger than a page (memory-mapped) still export"""
+    lyrics = "line\n" * 2000
+    (tmp_path / "big_metadata.json").write_text(
+        json.dumps({"id": "big", "is_liked": True, "metadata": {"prompt": lyrics}})
+    )
+
+    export_text(tmp_path, tmp_path / "export.json")
+
+    song = json.loads((tmp_path / "export.json").read_text())["songs"][0]
+    assert song["lyrics"] == lyrics
+
+
+def test_export_text_json_matches_json_dump(tmp_path):
+    """Test the streamed JSON export is byte-identical to json.dump(indent=2)"""
+    for i, handle in enumerate(["b", "a"]):
+        (tmp_path / f"clip{i}_metadata.json").write_text(
+            json.dumps(
+                {
+                    "id": f"clip{i}",
+                    "title": "Café",
+                    "handle": handle,
+                    "display_tags": ["pop", "lo-fi"],
+                    "is_liked": True,
+                    "metadata": {"prompt": "one\ntwo", "duration": 61.5},
+                }
+            )
+        )
+    output_json = tmp_path / "out" / "export.json"
+
+    export_text(tmp_path, output_json)
+
+    data = json.loads(output_json.read_bytes())
+    assert [s["handle"] for s in data["songs"]] == ["a", "b"]
+    expected = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    assert output_json.read_bytes() == expected
@@ -1,3 +1,4 @@
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -33,15 +34,38 @@ def test_track_analyze_runs_with_chords_and_notes(capsys, tmp_path):
         assert call_kwargs["notes"] is True
 
 
+def test_track_analyze_passes_sample_rate(tmp_path):
+    with patch("toolshop.cli.reverse_engineering_adapter") as mock_adapter:
+        mock_adapter.analyze_track.return_value = {"analysis_backend": "basic_librosa"}
+        test_file = tmp_path / "test.wav"
+        test_file.touch()
+        cli.main(["track", "analyze", str(test_file), "--sr", "16000"])
+        assert mock_adapter.analyze_track.call_args.kwargs["target_sr"] == 16000
+
+
+def test_track_analyze_passes_precise_key(tmp_path):
+    with patch("toolshop.cli.reverse_engineering_adapter") as mock_adapter:
+        mock_adapter.analyze_track.return_value = {"analysis_backend": "basic_librosa"}
+        test_file = tmp_path / "test.wav"
+        test_file.touch()
+        cli.main(["track", "analyze", str(test_file), "--backend", "basic", "--precise-key"])
+        assert mock_adapter.analyze_track.call_args.kwargs["precise_key"] is True
+
+
 def test_track_batch_runs(capsys, tmp_path):
     with patch("toolshop.cli.reverse_engineering_adapter") as mock_adapter:
-        mock_adapter.analyze_track.return_value = {"analysis_backend": "wav_reverse_engineer"}
+        mock_adapter.analyze_tracks.return_value = [
+            {"analysis_backend": "wav_reverse_engineer"}
+        ] * 2
         (tmp_path / "a.wav").touch()
         (tmp_path / "b.wav").touch()
         output = tmp_path / "batch.json"
-        cli.main(["track", "batch", str(tmp_path), "--output", str(output)])
+        cli.main(["track", "batch", str(tmp_path), "--output", str(output), "--workers", "2"])
         assert output.exists()
-        assert mock_adapter.analyze_track.call_count == 2
+        files = mock_adapter.analyze_tracks.call_args.args[0]
+        assert [f.name for f in files] == ["a.wav", "b.wav"]
+        assert mock_adapter.analyze_tracks.call_args.kwargs["workers"] == 2
+        assert json.loads(output.read_text())["files_analyzed"] == 2
 
 
 def test_track_yt_analyze_runs(capsys, tmp_path):
@@ -20,8 +20,9 @@ from toolshop.video_features import (
 def mock_librosa():
     with patch("toolshop.video_features.librosa") as mock_lib, patch(
         "toolshop.video_features.np"
-    ) as mock_np:
-        mock_lib.load.return_value = (MagicMock(), 22050)
+    ) as mock_np, patch(
+        "toolshop.video_features.load_audio", return_value=(MagicMock(), 22050)
+    ):
         mock_lib.get_duration.return_value = 30.0
         mock_lib.beat.beat_track.return_value = (128.0, None)
         mock_lib.feature.chroma_cqt.return_value = MagicMock()
@@ -39,8 +39,9 @@ def test_end_to_end_features_to_video(tmp_path, _fake_audio):
     features_path = tmp_path / "features.json"
     with patch("toolshop.video_features._HAS_LIBROSA", True), patch(
         "toolshop.video_features.librosa"
-    ) as mock_lib, patch("toolshop.video_features.np") as mock_np:
-        mock_lib.load.return_value = (MagicMock(), 22050)
+    ) as mock_lib, patch("toolshop.video_features.np") as mock_np, patch(
+        "toolshop.video_features.load_audio", return_value=(MagicMock(), 22050)
+    ):
         mock_lib.get_duration.return_value = 5.0
         mock_lib.beat.beat_track.return_value = (120.0, MagicMock())
         mock_lib.frames_to_time.return_value = MagicMock()
@@ -2,7 +2,20 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from toolshop.voice_effects_adapter import analyze_voice, print_voice_summary
+from toolshop.voice_effects_adapter import (
+    _band_slices,
+    _freq_bins,
+    analyze_voice,
+    print_voice_summary,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_band_caches():
+    """Don't let bins computed under a mocked librosa/numpy leak between tests"""
+    yield
+    _freq_bins.cache_clear()
+    _band_slices.cache_clear()
 
 
 def test_analyze_voice_missing_librosa():
@@ -20,14 +33,15 @@ def test_analyze_voice_file_not_found():
 
 
 @patch("toolshop.voice_effects_adapter._HAS_LIBROSA", True)
+@patch("toolshop.voice_effects_adapter.load_audio")
 @patch("toolshop.voice_effects_adapter.librosa")
 @patch("toolshop.voice_effects_adapter.np")
-def test_analyze_voice_basic_structure(mock_np, mock_librosa, tmp_path):
+def test_analyze_voice_basic_structure(mock_np, mock_librosa, mock_load_audio, tmp_path):
     """Test analyze_voice basic structure with minimal mocking"""
     # Setup minimal mocks
     mock_y = MagicMock()
     mock_sr = 22050
-    mock_librosa.load.return_value = (mock_y, mock_sr)
+    mock_load_audio.return_value = (mock_y, mock_sr)
     mock_librosa.get_duration.return_value = 120.0
 
     # Create test file
@@ -70,3 +84,323 @@ def test_print_voice_summary_no_voice(capsys):
     assert "test.wav" in captured.out
     assert "Voice:" in captured.out
     assert "Not detected" in captured.out
+
+
+def test_feature_cache_shares_one_stft():
+    """Test detectors reuse the cached STFT instead of recomputing it"""
+    import numpy as np
+    import librosa
+
+    from toolshop.voice_effects_adapter import (
+        FeatureCache,
+        detect_chorus,
+        detect_deessing,
+        detect_eq,
+    )
+
+    sr = 22050
+    y = (0.1 * np.sin(2 * np.pi * 220 * np.arange(sr) / sr)).astype(np.float32)
+    ctx = FeatureCache(y, sr)
+
+    with patch("toolshop.voice_effects_adapter.librosa.stft", wraps=librosa.stft) as stft:
+        for detector in (detect_eq, detect_chorus, detect_deessing):
+            assert detector(ctx)["effect"]
+    assert stft.call_count == 1
+
+
+def test_analyze_voice_parallel_matches_sequential(tmp_path):
+    """Test running detectors in worker processes gives the same results"""
+    import numpy as np
+    import soundfile as sf
+
+    sr = 22050
+    t = np.arange(sr) / sr
+    y = 0.2 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 360 * t)
+    path = tmp_path / "voice.wav"
+    sf.write(path, y.astype(np.float32), sr)
+
+    sequential = analyze_voice(path, workers=1)
+    parallel = analyze_voice(path, workers=2)
+
+    assert parallel["effects_detected"] == sequential["effects_detected"]
+
+
+def test_analyze_voice_parallel_computes_formants_once(tmp_path):
+    """Test the pool path runs the Praat formant analysis in the parent only"""
+    import numpy as np
+    import soundfile as sf
+    from toolshop import voice_effects_adapter
+
+    sr = 22050
+    t = np.arange(sr) / sr
+    y = 0.2 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 360 * t)
+    path = tmp_path / "voice.wav"
+    sf.write(path, y.astype(np.float32), sr)
+
+    sequential = analyze_voice(path, workers=1)
+    with patch(
+        "toolshop.voice_effects_adapter._get_formants_parselmouth",
+        wraps=voice_effects_adapter._get_formants_parselmouth,
+    ) as mock_formants:
+        parallel = analyze_voice(path, workers=2)
+
+    assert mock_formants.call_count == 1
+    assert parallel["effects_detected"] == sequential["effects_detected"]
+
+
+def test_voice_analyze_cli_defaults_to_one_worker(tmp_path):
+    """Test 'voice analyze' runs in-process unless --workers is given"""
+    from toolshop import cli
+
+    path = tmp_path / "voice.wav"
+    path.touch()
+    with patch(
+        "toolshop.voice_effects_adapter.analyze_voice", return_value={}
+    ) as mock_analyze, patch("toolshop.voice_effects_adapter.print_voice_summary"):
+        cli.main(["voice", "analyze", str(path)])
+        assert mock_analyze.call_args.kwargs["workers"] == 1
+        cli.main(["voice", "analyze", str(path), "--workers", "0"])
+        assert mock_analyze.call_args.kwargs["workers"] is None
+
+
+def test_formant_tracks_match_praat_queries():
+    """Test the per-frame formant tracks equal Praat's 'Get value at time'"""
+    np = pytest.importorskip("numpy")
+    parselmouth = pytest.importorskip("parselmouth")
+    from parselmouth.praat import call
+
+    from toolshop.voice_effects_adapter import _get_formants_parselmouth
+
+    sr = 22050
+    t = np.arange(sr // 2) / sr
+    y = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 20)).astype(np.float32)
+
+    medians, tracks = _get_formants_parselmouth(y, sr)
+
+    snd = parselmouth.Sound(y, sampling_frequency=sr)
+    formant = call(snd, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
+    assert tracks.shape == (3, int(call(formant, "Get number of frames")))
+    for i in (1, tracks.shape[1] // 2, tracks.shape[1]):
+        when = call(formant, "Get time from frame number", i)
+        expected = [
+            call(formant, "Get value at time", k, when, "hertz", "Linear") for k in (1, 2, 3)
+        ]
+        np.testing.assert_array_equal(tracks[:, i - 1], expected)
+    assert "F1" in medians
+
+
+def test_autocorr_matches_np_correlate():
+    """Test the FFT autocorrelation equals the direct non-negative lags"""
+    import numpy as np
+
+    from toolshop.voice_effects_adapter import _autocorr, _count_local_maxima
+
+    x = np.sin(np.arange(150) * 0.4) + 0.3 * np.random.default_rng(0).normal(size=150)
+    full = np.correlate(x, x, mode="full")
+    np.testing.assert_allclose(_autocorr(x), full[len(full) // 2 :], atol=1e-9)
+
+    a = np.array([0.0, 0.1, 0.5, 0.2, 0.25, 0.2, 0.9, 0.4])
+    assert _count_local_maxima(a, lo=2, threshold=0.3) == 2
+
+
+def test_decay_slopes_match_polyfit():
+    """Test batched decay slopes equal a per-row polyfit from the peak"""
+    import numpy as np
+
+    from toolshop.voice_effects_adapter import _decay_slopes, _linfit_slope
+
+    db = np.random.default_rng(1).normal(size=(6, 40))
+    db[1, 36] = 10.0  # tail too short
+    db[2, 30:] = 10.0  # flat tail from the peak
+    slopes, valid = _decay_slopes(db)
+    assert valid.tolist() == [True, False, False, True, True, True]
+    for row, slope, ok in zip(db, slopes, valid):
+        tail = row[np.argmax(row):]
+        if ok:
+            np.testing.assert_allclose(slope, np.polyfit(np.arange(len(tail)), tail, 1)[0])
+
+    np.testing.assert_allclose(_linfit_slope(db[0]), np.polyfit(np.arange(40), db[0], 1)[0])
+
+
+def test_mean_std_matches_numpy():
+    """Test the fused mean/std matches numpy and is exactly zero for constant input"""
+    import numpy as np
+
+    from toolshop.voice_effects_adapter import _mean_std
+
+    x = np.random.default_rng(2).normal(loc=500.0, scale=3.0, size=1000).astype(np.float32)
+    mean, std = _mean_std(x)
+    np.testing.assert_allclose(
+        [mean, std], [np.mean(x, dtype=np.float64), np.std(x, dtype=np.float64)]
+    )
+    assert _mean_std(np.full(50, 0.1, dtype=np.float32))[1] == 0.0
+
+
+def test_autocorr_range_matches_full_autocorr():
+    """Test the lag-range autocorrelation equals a slice of the full one"""
+    import numpy as np
+
+    from toolshop.voice_effects_adapter import _autocorr, _autocorr_range
+
+    x = np.random.default_rng(3).normal(size=300)
+    np.testing.assert_allclose(_autocorr_range(x, 2, 43), _autocorr(x)[2:43], atol=1e-9)
+    assert len(_autocorr_range(x[:10], 2, 43)) == 8
+
+
+def test_analyze_voice_skips_silent_audio(tmp_path):
+    """Test silent audio returns skipped results without running pyin or an STFT"""
+    import numpy as np
+    import soundfile as sf
+
+    path = tmp_path / "silence.wav"
+    sf.write(path, np.zeros(22050, dtype=np.float32), 22050)
+
+    with patch("toolshop.voice_effects_adapter.librosa.pyin") as pyin, patch(
+        "toolshop.voice_effects_adapter.librosa.stft"
+    ) as stft:
+        result = analyze_voice(path)
+    pyin.assert_not_called()
+    stft.assert_not_called()
+
+    assert result["voice_detected"] is False
+    assert result["spectral_profile"] == {}
+    assert len(result["effects_detected"]) == 12
+    assert all(e["confidence"] == 0.0 for e in result["effects_detected"])
+
+
+def test_analyze_voice_skips_voice_detectors_without_voice(tmp_path):
+    """Test voice-only detectors are skipped when no voice is detected"""
+    import numpy as np
+    import soundfile as sf
+
+    path = tmp_path / "noise.wav"
+    noise = 0.1 * np.random.default_rng(0).normal(size=22050)
+    sf.write(path, noise.astype(np.float32), 22050)
+
+    with patch("toolshop.voice_effects_adapter._librosa_f0", return_value=None), patch(
+        "toolshop.voice_effects_adapter.librosa.pyin"
+    ) as pyin:
+        result = analyze_voice(path)
+    pyin.assert_not_called()
+
+    assert result["voice_detected"] is False
+    effects = {e["effect"]: e for e in result["effects_detected"]}
+    for name in ("pitch_shift", "formant_shift", "auto-tune", "de-essing", "vocoder"):
+        assert effects[name]["evidence"] == ["Skipped: no voice detected"]
+    assert effects["reverb"]["evidence"] != ["Skipped: no voice detected"]
+
+
+def test_analyze_voice_long_input_merges_windows(tmp_path):
+    """Test long inputs are analyzed per window and merged to one result per detector"""
+    import numpy as np
+    import soundfile as sf
+
+    sr = 22050
+    t = np.arange(3 * sr) / sr
+    y = 0.2 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 360 * t)
+    path = tmp_path / "long.wav"
+    sf.write(path, y.astype(np.float32), sr)
+
+    with patch("toolshop.voice_effects_adapter._LONG_AUDIO_SECONDS", 2.0), patch(
+        "toolshop.voice_effects_adapter._WINDOW_SECONDS", 2.0
+    ):
+        result = analyze_voice(path)
+
+    effects = result["effects_detected"]
+    assert len(effects) == 12
+    assert len({e["effect"] for e in effects}) == 12
+    assert result["fundamental_frequency_hz"] == pytest.approx(180, abs=5)
+    assert set(result["spectral_profile"]) == {
+        "centroid_hz",
+        "bandwidth_hz",
+        "rolloff_hz",
+        "flatness",
+    }
+    assert all("windows" in e["evidence"][-1] for e in effects)
+
+
+def test_analyze_windows_reports_raw_confidence_of_best_window():
+    """Test energy weighting picks the window but does not scale its confidence"""
+    import numpy as np
+    from toolshop.voice_effects_adapter import _DETECTORS, _analyze_windows
+
+    sr = 22050
+    t = np.arange(3 * sr) / sr
+    y = np.sin(2 * np.pi * 180 * t) * np.where(t < 1.0, 1.0, 0.5)
+    # Windows are 0-2s and 1-3s; the quieter second one is far more confident.
+    window_confidences = iter([0.1, 0.9])
+
+    def fake_detect(ctx, pool=None, verbose=True, voice_detected=True):
+        confidence = next(window_confidences)
+        return [
+            {
+                "effect": name,
+                "detected": False,
+                "confidence": confidence,
+                "params": {},
+                "evidence": [],
+            }
+            for name, _, _ in _DETECTORS
+        ]
+
+    with patch("toolshop.voice_effects_adapter._WINDOW_SECONDS", 2.0), patch(
+        "toolshop.voice_effects_adapter._detect_effects", side_effect=fake_detect
+    ):
+        _, _, effects = _analyze_windows(y.astype(np.float32), sr)
+
+    assert [e["confidence"] for e in effects] == [0.9] * len(_DETECTORS)
+    assert all("Strongest in 1-3s" in e["evidence"][-1] for e in effects)
+
+
+def test_analyze_windows_ignores_voice_gated_windows():
+    """Test an unvoiced intro window does not mask a voice detector's later results"""
+    import numpy as np
+    from toolshop.voice_effects_adapter import _analyze_windows
+
+    sr = 22050
+    y = (0.1 * np.sin(2 * np.pi * 180 * np.arange(4 * sr) / sr)).astype(np.float32)
+    # Windows are 0-2s, 1-3s and 2-4s; only the first is unvoiced.
+    f0s = iter([None, 180.0, 180.0])
+    spreads = iter([2.0, 4.0])
+
+    def fake_overview(ctx):
+        return next(f0s), {"flatness": 0.1}
+
+    def pitch_detector(ctx):
+        params = {"f0_std": next(spreads)}
+        return {"effect": "pitch", "confidence": 0.0, "params": params, "evidence": ["ran"]}
+
+    def level_detector(ctx):
+        return {"effect": "level", "confidence": 0.0, "params": {}, "evidence": ["ran"]}
+
+    detectors = [("Pitch", pitch_detector, True), ("Level", level_detector, False)]
+    with patch("toolshop.voice_effects_adapter._WINDOW_SECONDS", 2.0), patch(
+        "toolshop.voice_effects_adapter._voice_overview", side_effect=fake_overview
+    ), patch("toolshop.voice_effects_adapter._DETECTORS", detectors):
+        f0, _, (pitch, level) = _analyze_windows(y, sr)
+
+    assert f0 == 180.0
+    assert pitch["evidence"][0] == "ran"
+    assert pitch["params"] == {"f0_std": 3.0}
+    assert "of 2 windows" in pitch["evidence"][-1]
+    assert "of 3 windows" in level["evidence"][-1]
+
+
+def test_analyze_voice_batch_keeps_order_and_reports_errors(tmp_path):
+    """Test batch analysis returns one result per path, with an error record for bad files"""
+    import numpy as np
+    import soundfile as sf
+
+    from toolshop.voice_effects_adapter import analyze_voice_batch
+
+    sr = 22050
+    t = np.arange(sr) / sr
+    path = tmp_path / "tone.wav"
+    sf.write(path, (0.2 * np.sin(2 * np.pi * 180 * t)).astype(np.float32), sr)
+    missing = tmp_path / "missing.wav"
+
+    results = analyze_voice_batch([path, missing], workers=1)
+
+    assert [r["file"] for r in results] == [str(path), str(missing)]
+    assert len(results[0]["effects_detected"]) == 12
+    assert "not found" in results[1]["error"]
@@ -2,7 +2,15 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from toolshop.yt_scraper_adapter import search, get_info, download_audio
+from toolshop.yt_scraper_adapter import clear_cache, search, get_info, download_audio
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Each test mocks yt-dlp differently; don't serve one test's results to another"""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 def test_search_basic():
@@ -114,7 +122,8 @@ def test_download_audio_success(tmp_path):
         expected_path.touch()
 
         # Mock the download call
-        mock_ydl.download.return_value = None
+        mock_ydl.extract_info.return_value = {"id": "test123", "title": "test_song"}
+        mock_ydl.prepare_filename.return_value = str(tmp_path / "test_song.webm")
 
         result = download_audio("http://youtube.com/watch?v=test123", tmp_path, "wav")
 
@@ -131,7 +140,8 @@ def test_download_audio_default_format(tmp_path):
         expected_path = tmp_path / "test_song.wav"
         expected_path.touch()
 
-        mock_ydl.download.return_value = None
+        mock_ydl.extract_info.return_value = {"id": "test123", "title": "test_song"}
+        mock_ydl.prepare_filename.return_value = str(tmp_path / "test_song.m4a")
 
         # Call without format parameter
         result = download_audio("http://youtube.com/watch?v=test123", tmp_path)
@@ -139,6 +149,27 @@ def test_download_audio_default_format(tmp_path):
         assert result == expected_path
 
 
+def test_download_audio_ignores_earlier_downloads(tmp_path):
+    """Test download_audio returns this download, not another file in the directory"""
+    with patch("toolshop.yt_scraper_adapter.yt_dlp.YoutubeDL") as mock_ydl_class:
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+
+        (tmp_path / "a_previous_song.wav").touch()
+        expected_path = tmp_path / "new_song.wav"
+        expected_path.touch()
+
+        mock_ydl.extract_info.return_value = {"id": "test123", "title": "new_song"}
+        mock_ydl.prepare_filename.return_value = str(tmp_path / "new_song.webm")
+
+        result = download_audio("test123", tmp_path)
+
+        assert result == expected_path
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/watch?v=test123", download=True
+        )
+
+
 @patch("toolshop.yt_scraper_adapter.yt_dlp")
 def test_download_error_handling(mock_yt_dlp, tmp_path):
     """Test download_audio handles errors gracefully"""
@@ -146,3 +177,18 @@ def test_download_error_handling(mock_yt_dlp, tmp_path):
 
     with pytest.raises(Exception, match="Download failed"):
         download_audio("http://youtube.com/watch?v=test123", tmp_path)
+
+
+def test_get_info_is_cached():
+    """Test repeated lookups of one video reuse the first extraction"""
+    with patch("toolshop.yt_scraper_adapter.yt_dlp.YoutubeDL") as mock_ydl_class:
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "test123", "title": "Test Song", "tags": ["a"]}
+
+        first = get_info("test123")
+        first["tags"].append("mutated")
+        second = get_info("https://www.youtube.com/watch?v=test123")
+
+        assert mock_ydl.extract_info.call_count == 1
+        assert second["tags"] == ["a"]
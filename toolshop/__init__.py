@@ -1,12 +1,6 @@
 """Music AI toolshop package."""
 
-from . import cleaning_stages
-from . import cleaning_pipeline_adapter
-from . import reverse_engineering_adapter
-from . import genius_adapter
-from . import genius_parser
-from . import lyrics_analyzer
-from . import remix_adapter
+import importlib
 
 __all__ = [
     "cli",
@@ -19,3 +13,11 @@ __all__ = [
     "lyrics_analyzer",
     "remix_adapter",
 ]
+
+
+def __getattr__(name):
+    # Submodules load on first access so `toolshop --help` does not import
+    # librosa/numpy through the package.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
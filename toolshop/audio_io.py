@@ -0,0 +1,197 @@
+"""Shared audio loading for the analysis adapters.
+
+Reads with soundfile and resamples with scipy so analysis does not pay for
+librosa's audioread/float64 path; anything libsndfile cannot decode falls
+back to ``librosa.load``.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import librosa
+except ImportError:
+    librosa = None
+
+try:
+    import soundfile as sf
+    from scipy.signal import resample_poly
+except ImportError:
+    sf = None
+
+try:
+    import scipy.fft as sfft
+except ImportError:
+    sfft = None
+
+
+def _check_backend() -> None:
+    if np is None or (sf is None and librosa is None):
+        raise RuntimeError(
+            "numpy plus soundfile and scipy (or librosa) are required for audio loading. "
+            "Install with: pip install numpy soundfile scipy"
+        )
+
+
+def _librosa_load(path: Path, target_sr: int, duration: Optional[float]) -> Any:
+    """Fallback for formats libsndfile cannot decode."""
+    if librosa is None:
+        raise RuntimeError(
+            f"{path} cannot be decoded by soundfile and librosa is not installed. "
+            "Install with: pip install librosa"
+        )
+    y, _ = librosa.load(str(path), sr=target_sr, mono=True, duration=duration)
+    return y.astype(np.float32, copy=False)
+
+
+def _mono(y: Any) -> Any:
+    """Downmix a soundfile block to mono float32.
+
+    Everything downstream stays float32; a float64 signal here would double
+    the memory traffic of every STFT and reduction after it.
+    """
+    if y.ndim == 2:
+        y = y.mean(axis=1, dtype=np.float32)
+    return y
+
+
+def _mono_at(y: Any, sr: int, target_sr: int) -> Any:
+    """Downmix a soundfile block to mono float32 and resample to ``target_sr``."""
+    y = _mono(y)
+    if sr != target_sr:
+        g = math.gcd(sr, target_sr)
+        y = resample_poly(y, target_sr // g, sr // g).astype(np.float32, copy=False)
+    return y
+
+
+def _resample_stream(blocks: Iterable[Any], sr: int, target_sr: int) -> Iterator[Any]:
+    """Resample consecutive mono blocks as one continuous signal.
+
+    Each block is filtered together with enough of its neighbours to cover
+    ``resample_poly``'s filter, and block edges fall on whole output samples,
+    so the output matches resampling the concatenated signal; there are no
+    filter restarts at block boundaries.
+    """
+    if sr == target_sr:
+        yield from blocks
+        return
+    g = math.gcd(sr, target_sr)
+    up, down = target_sr // g, sr // g
+    # resample_poly's default filter spans 10 * max(up, down) upsampled taps
+    # each side; rounding up to a multiple of ``down`` keeps edges aligned.
+    pad = down * math.ceil((10 * max(up, down) / up + 1) / down)
+    carry = np.zeros(0, dtype=np.float32)
+    head = 0  # leading samples of ``carry`` already emitted, kept as context
+    for block in blocks:
+        buf = np.concatenate([carry, block])
+        n_emit = (len(buf) - head - pad) // down * down
+        if n_emit <= 0:
+            carry = buf
+            continue
+        out = resample_poly(buf[: head + n_emit + pad], up, down)
+        yield out[head * up // down : (head + n_emit) * up // down].astype(np.float32, copy=False)
+        keep = min(pad, head + n_emit)
+        carry = buf[head + n_emit - keep :]
+        head = keep
+    if len(carry) > head:
+        out = resample_poly(carry, up, down)
+        yield out[head * up // down :].astype(np.float32, copy=False)
+
+
+def load_audio(
+    path: Path,
+    target_sr: int = 22050,
+    duration: Optional[float] = None,
+) -> Tuple[Any, int]:
+    """Load mono float32 audio at ``target_sr``.
+
+    Reads with soundfile directly and resamples with ``resample_poly`` only when
+    the native rate differs, skipping librosa's audioread/float64 round trip.
+    Formats libsndfile cannot decode fall back to ``librosa.load``.
+    """
+    _check_backend()
+    if sf is not None:
+        try:
+            with sf.SoundFile(str(path)) as f:
+                sr = f.samplerate
+                frames = -1 if duration is None else int(duration * sr)
+                y = f.read(frames=frames, dtype="float32", always_2d=False)
+        except RuntimeError:
+            pass
+        else:
+            return _mono_at(y, sr, target_sr), target_sr
+    return _librosa_load(path, target_sr, duration), target_sr
+
+
+def audio_duration(path: Path) -> float:
+    """Full length of an audio file in seconds, read from its header when possible."""
+    _check_backend()
+    if sf is not None:
+        try:
+            return float(sf.info(str(path)).duration)
+        except RuntimeError:
+            pass
+    if librosa is None:
+        raise RuntimeError(
+            f"{path} cannot be decoded by soundfile and librosa is not installed. "
+            "Install with: pip install librosa"
+        )
+    return float(librosa.get_duration(path=str(path)))
+
+
+def iter_audio_blocks(
+    path: Path,
+    target_sr: int = 22050,
+    duration: Optional[float] = None,
+    block_seconds: float = 30.0,
+) -> Iterator[Any]:
+    """Yield mono float32 blocks of about ``block_seconds`` at ``target_sr``.
+
+    Peak memory is bounded by the block size rather than the file length.
+    Blocks are read at the native rate and resampled as one continuous
+    stream, so block boundaries add no filter transients.
+    Formats libsndfile cannot decode are loaded whole and yielded as one block.
+    """
+    _check_backend()
+    f = None
+    if sf is not None:
+        try:
+            f = sf.SoundFile(str(path))
+        except RuntimeError:
+            f = None
+    if f is None:
+        yield _librosa_load(path, target_sr, duration)
+        return
+    with f:
+        sr = f.samplerate
+        frames = -1 if duration is None else int(duration * sr)
+        blocks = f.blocks(
+            blocksize=int(block_seconds * sr), frames=frames, dtype="float32", always_2d=False
+        )
+        yield from _resample_stream(map(_mono, blocks), sr, target_sr)
+
+
+@contextmanager
+def fft_workers() -> Iterator[None]:
+    """Let scipy.fft (librosa's FFT backend) use every core in the main process.
+
+    Inside pool workers FFTs stay single-threaded so process- and
+    thread-level parallelism do not oversubscribe the CPU. Usable as a
+    decorator.
+    """
+    if sfft is None:
+        yield
+        return
+    in_worker = multiprocessing.current_process().name != "MainProcess"
+    with sfft.set_workers(1 if in_worker else -1):
+        yield
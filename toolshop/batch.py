@@ -51,13 +51,40 @@ def _norm_path(path: Any) -> str:
     return s
 
 
+def _scan_audio_paths(root: Path, exts: set, skip_hidden: bool = False) -> List[str]:
+    """Walk ``root`` once with ``os.scandir`` and return matching file paths.
+
+    Suffixes are compared on ``DirEntry.name`` directly, so no ``Path`` is
+    built per entry and ``is_dir`` reuses the cached d_type. With
+    ``skip_hidden``, dot-directories are not descended into.
+    """
+    stack = [str(root)]
+    found: List[str] = []
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not (skip_hidden and entry.name.startswith(".")):
+                        stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot >= 0 and name[dot + 1 :].lower() in exts:
+                    found.append(entry.path)
+    return found
+
+
 def discover_files(input_dir: Path, extensions: List[str], limit: int = 0, offset: int = 0) -> List[Path]:
     """Discover and return a sorted, sliced list of audio files."""
     exts = {e.lower().lstrip(".") for e in extensions}
-    tracks: List[Path] = []
-    for ext in exts:
-        tracks.extend(input_dir.rglob(f"*.{ext}"))
-    tracks = sorted({p.resolve() for p in tracks}, key=lambda p: p.name.lower())
+    tracks = sorted(
+        {Path(p).resolve() for p in _scan_audio_paths(input_dir, exts)},
+        key=lambda p: p.name.lower(),
+    )
     if offset:
         tracks = tracks[offset:]
     if limit > 0:
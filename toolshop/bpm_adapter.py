@@ -5,9 +5,18 @@ Uses librosa for standalone BPM/key detection.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import batch
+from .audio_io import fft_workers, load_audio
 
 try:
     import librosa
@@ -17,6 +26,21 @@ try:
 except ImportError:
     _HAS_LIBROSA = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_KEYS = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_SR = 22050
+_N_FFT = 2048
+_HOP_LENGTH = 512
+
+# Krumhansl-Kessler tonal profiles, tonic first.
+_MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+_MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
 
 def _check_librosa() -> None:
     if not _HAS_LIBROSA:
@@ -25,11 +49,65 @@ def _check_librosa() -> None:
         )
 
 
-def analyze_track(path: Path) -> Dict[str, Any]:
+def _zscore(x: Any) -> Any:
+    return (x - x.mean(axis=0)) / (x.std(axis=0) + 1e-12)
+
+
+@lru_cache(maxsize=1)
+def _key_profiles() -> Any:
+    """(12, 2) matrix of z-scored major/minor profiles."""
+    return _zscore(np.array([_MAJOR_PROFILE, _MINOR_PROFILE]).T)
+
+
+def estimate_key(chroma_mean: Any) -> Tuple[str, str]:
+    """Pick (key, mode) from a 12-bin mean chroma with Krumhansl-Schmuckler.
+
+    Correlates the chroma, rotated to each of the 12 tonics, against the
+    major and minor profiles and returns the best match. The rotations are a
+    strided view over the doubled vector, so no 12x12 copy is made.
+    """
+    z = _zscore(np.asarray(chroma_mean, dtype=np.float64))
+    doubled = np.concatenate([z, z])
+    stride = doubled.strides[0]
+    rotations = np.lib.stride_tricks.as_strided(
+        doubled, shape=(12, 12), strides=(stride, stride), writeable=False
+    )
+    scores = rotations @ _key_profiles()
+    key_idx, mode_idx = divmod(int(scores.argmax()), 2)
+    return _KEYS[key_idx], ("major", "minor")[mode_idx]
+
+
+@lru_cache(maxsize=32)
+def _chroma_filterbank(sr: int, n_fft: int, tuning: float) -> Any:
+    return librosa.filters.chroma(sr=sr, n_fft=n_fft, n_chroma=12, tuning=tuning)
+
+
+def chroma_from_power(
+    S_power: Any,
+    sr: int,
+    n_fft: int = _N_FFT,
+    tuning: Optional[float] = None,
+) -> Tuple[Any, float]:
+    """``chroma_stft(S=S_power)`` with a memoized filter bank.
+
+    Returns the chroma and the tuning offset used, so callers that stream a
+    file in blocks can estimate tuning once and pass it back in.
+    """
+    if tuning is None:
+        tuning = float(librosa.estimate_tuning(S=S_power, sr=sr, bins_per_octave=12))
+    tuning = round(tuning, 2)
+    chroma = _chroma_filterbank(sr, n_fft, tuning) @ S_power
+    return librosa.util.normalize(chroma, norm=np.inf, axis=-2), tuning
+
+
+def analyze_track(path: Path, precise_key: bool = False) -> Dict[str, Any]:
     """Analyze a single audio file for BPM, key, and basic features.
 
     Args:
         path: Path to an audio file (WAV recommended).
+        precise_key: Estimate key from a CQT chroma instead of the cheaper
+            STFT chroma. The CQT's extra low-frequency resolution is mostly
+            lost once chroma is averaged over the whole track.
 
     Returns:
         Dictionary with keys: bpm, key, mode, duration, sample_rate, etc.
@@ -38,22 +116,28 @@ def analyze_track(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Audio file not found: {path}")
 
-    y, sr = librosa.load(str(path), sr=22050, mono=True)
+    y, sr = load_audio(path)
+    return _analyze_signal(path, y, sr, precise_key=precise_key)
+
+
+@fft_workers()
+def _analyze_signal(path: Path, y: Any, sr: int, precise_key: bool = False) -> Dict[str, Any]:
+    """Feature half of :func:`analyze_track`, for audio that is already decoded."""
     duration = librosa.get_duration(y=y, sr=sr)
+    S_power = np.abs(librosa.stft(y, n_fft=_N_FFT, hop_length=_HOP_LENGTH)) ** 2
 
     # BPM
-    tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+    mel = librosa.feature.melspectrogram(S=S_power, sr=sr)
+    onset_env = librosa.onset.onset_strength(S=librosa.power_to_db(mel), sr=sr)
+    tempo, _ = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
     bpm = float(np.atleast_1d(tempo)[0])
 
     # Key estimation via chroma
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
-    chroma_mean = np.mean(chroma, axis=1)
-    key_idx = int(np.argmax(chroma_mean))
-    keys = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    key = keys[key_idx]
-
-    # Simple major/minor heuristic
-    mode = "major" if chroma_mean[key_idx] > 0.5 else "minor"
+    if precise_key:
+        chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
+    else:
+        chroma, _ = chroma_from_power(S_power, sr)
+    key, mode = estimate_key(chroma.mean(axis=1, dtype=np.float32))
 
     return {
         "file": str(path),
@@ -65,42 +149,295 @@ def analyze_track(path: Path) -> Dict[str, Any]:
     }
 
 
+@fft_workers()
+def analyze_track_bpm_only(path: Path) -> Dict[str, Any]:
+    """Estimate only the global tempo of an audio file.
+
+    Skips the beat grid (librosa's dynamic-programming tracker) and chroma,
+    so it is several times cheaper than :func:`analyze_track`.
+
+    Returns:
+        Dictionary with keys: file, bpm, duration_seconds, sample_rate.
+    """
+    _check_librosa()
+    if not path.exists():
+        raise FileNotFoundError(f"Audio file not found: {path}")
+
+    y, sr = load_audio(path)
+    onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+    tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=sr)
+    bpm = float(np.atleast_1d(tempo)[0])
+
+    return {
+        "file": str(path),
+        "bpm": round(bpm, 2),
+        "duration_seconds": round(librosa.get_duration(y=y, sr=sr), 2),
+        "sample_rate": sr,
+    }
+
+
+def _warmup() -> None:
+    """Trigger librosa's numba JIT on a silent clip via the analyze_track path.
+
+    Used as the process-pool initializer so each worker compiles before its
+    first real file rather than during it.
+    """
+    y = np.zeros(_SR, dtype=np.float32)
+    S_power = np.abs(librosa.stft(y, n_fft=_N_FFT, hop_length=_HOP_LENGTH)) ** 2
+    mel = librosa.feature.melspectrogram(S=S_power, sr=_SR)
+    onset_env = librosa.onset.onset_strength(S=librosa.power_to_db(mel), sr=_SR)
+    librosa.beat.beat_track(onset_envelope=onset_env, sr=_SR)
+    chroma_from_power(S_power, _SR, tuning=0.0)
+
+
+def _load_safe(path: Path) -> Tuple[Path, Any]:
+    """Decode ``path`` for the pipeline, carrying any error along instead of raising."""
+    try:
+        if not path.exists():
+            raise FileNotFoundError(f"Audio file not found: {path}")
+        return path, load_audio(path)
+    except Exception as e:
+        return path, e
+
+
+def _analyze_loaded_safe(item: Tuple[Path, Any]) -> Dict[str, Any]:
+    """Process-pool half of the pipeline: features for one decoded file."""
+    path, loaded = item
+    if isinstance(loaded, Exception):
+        return {"file": str(path), "error": str(loaded)}
+    try:
+        return _analyze_signal(path, *loaded)
+    except Exception as e:
+        return {"file": str(path), "error": str(e)}
+
+
+def _pipeline(
+    paths: List[Path],
+    io_pool: Executor,
+    compute_pool: Executor,
+    depth: int,
+) -> Iterator[Dict[str, Any]]:
+    """Decode on ``io_pool`` while ``compute_pool`` analyzes, yielding in order.
+
+    At most ``depth`` decoded files wait for compute and ``depth`` more are
+    being decoded, so memory stays bounded however long ``paths`` is.
+    """
+    todo = iter(paths)
+    decoding: Deque[Future] = deque(io_pool.submit(_load_safe, p) for p in islice(todo, depth))
+    computing: Deque[Future] = deque()
+    while decoding or computing:
+        if decoding and len(computing) < depth:
+            item = decoding.popleft().result()
+            nxt = next(todo, None)
+            if nxt is not None:
+                decoding.append(io_pool.submit(_load_safe, nxt))
+            computing.append(compute_pool.submit(_analyze_loaded_safe, item))
+        else:
+            yield computing.popleft().result()
+
+
+def _analyze_track_safe(path: Path) -> Dict[str, Any]:
+    """Run :func:`analyze_track`, returning an error record instead of raising.
+
+    Top-level so it can be pickled into worker processes; one unreadable file
+    must not abort the rest of the pool.
+    """
+    try:
+        return analyze_track(path)
+    except Exception as e:
+        return {"file": str(path), "error": str(e)}
+
+
+_CACHE_SUBDIR = "bpm_cache"
+# Bump when analyze_track's output changes so stale cache entries are dropped.
+_CACHE_SCHEMA_VERSION = 2
+
+
+def _fingerprint(path: Path) -> Optional[str]:
+    """Content key for a file: size, mtime and its first 1 MiB / last 64 KiB.
+
+    Hashing only the ends keeps re-scans close to directory-walk speed.
+    """
+    try:
+        st = path.stat()
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+        with path.open("rb") as f:
+            h.update(f.read(1 << 20))
+            if st.st_size > 1 << 20:
+                f.seek(max(st.st_size - (1 << 16), 1 << 20))
+                h.update(f.read())
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def _data_root() -> Path:
+    default = Path(__file__).resolve().parent.parent / "data" / "toolshop"
+    return Path(os.environ.get("TOOLSHOP_DATA_DIR", str(default)))
+
+
+def _cache_path(root: Path) -> Path:
+    """Cache file for a library root, kept under the data dir, not the library."""
+    key = hashlib.blake2b(str(root.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return _data_root() / _CACHE_SUBDIR / f"{key}.json"
+
+
+def _cache_version() -> str:
+    return f"{_CACHE_SCHEMA_VERSION}:{getattr(librosa, '__version__', '')}"
+
+
+def _load_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return cached results by fingerprint, or {} if missing/stale/corrupt."""
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _cache_version():
+        return {}
+    return data.get("entries", {})
+
+
+def _save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write the cache atomically so an interrupted scan cannot corrupt it."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"version": _cache_version(), "entries": entries}, f)
+    os.replace(tmp, cache_path)
+
+
+def _ndjson_line(result: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(result) + b"\n"
+    return json.dumps(result).encode("utf-8") + b"\n"
+
+
 def analyze_library(
     root: Path,
     extensions: Optional[List[str]] = None,
     output_json: Optional[Path] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    return_results: bool = True,
 ) -> List[Dict[str, Any]]:
     """Analyze all audio files under a directory for BPM/key.
 
+    Files are analyzed in a process pool since each track is an independent,
+    CPU-bound librosa pipeline. Results are cached under
+    ``<TOOLSHOP_DATA_DIR>/bpm_cache/`` (one file per library root) keyed by
+    file fingerprint, so re-scans only analyze new or changed files.
+
     Args:
         root: Root directory to walk.
         extensions: List of extensions to include (default: wav).
-        output_json: If provided, write results to this JSON file.
+        output_json: If provided, write results to this file. A ``.ndjson``
+            path is streamed one line per file as results arrive; any other
+            suffix gets a single JSON array at the end.
+        workers: Worker processes (default: CPU count). 1 runs in-process.
+        use_cache: Reuse and update the on-disk result cache.
+        return_results: Keep results in memory and return them. Set to False
+            with an ``.ndjson`` output to keep memory flat on huge libraries.
 
     Returns:
-        List of analysis results (one dict per file).
+        List of analysis results (one dict per file, in path order), or an
+        empty list when ``return_results`` is False and output is streamed.
     """
     _check_librosa()
     if extensions is None:
         extensions = ["wav"]
 
-    results: List[Dict[str, Any]] = []
-    for ext in extensions:
-        for audio_path in root.rglob(f"*.{ext}"):
-            try:
-                result = analyze_track(audio_path)
-                results.append(result)
-                print(
-                    f"✓ {audio_path.name}: {result['bpm']} BPM, {result['key']} {result['mode']}"
-                )
-            except Exception as e:
-                print(f"✗ {audio_path.name}: {e}")
-                results.append({"file": str(audio_path), "error": str(e)})
+    exts = {e.lower().lstrip(".") for e in extensions}
+    paths = sorted(Path(p) for p in batch._scan_audio_paths(root, exts, skip_hidden=True))
 
-    if output_json:
+    cache_path = _cache_path(root)
+    cache = _load_cache(cache_path) if use_cache else {}
+    fingerprints = [_fingerprint(p) for p in paths] if use_cache else [None] * len(paths)
+
+    stream = None
+    if output_json and output_json.suffix == ".ndjson":
+        output_json.parent.mkdir(parents=True, exist_ok=True)
+        stream = output_json.open("wb")
+    keep = return_results or (output_json is not None and stream is None)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(paths) if keep else []
+    written = 0
+    cache_dirty = False
+
+    def emit(i: int, result: Dict[str, Any]) -> None:
+        nonlocal written
+        if keep:
+            results[i] = result
+        if stream is not None:
+            stream.write(_ndjson_line(result))
+            written += 1
+            if written % 64 == 0:
+                stream.flush()
+
+    try:
+        pending: List[int] = []
+        for i, fp in enumerate(fingerprints):
+            hit = cache.get(fp) if fp else None
+            if hit is not None:
+                emit(i, dict(hit, file=str(paths[i])))
+            else:
+                pending.append(i)
+        if len(pending) < len(paths):
+            print(f"Reusing {len(paths) - len(pending)} cached result(s)")
+
+        def on_result(i: int, result: Dict[str, Any]) -> None:
+            nonlocal cache_dirty
+            if fingerprints[i] and "error" not in result:
+                cache[fingerprints[i]] = result
+                cache_dirty = True
+            emit(i, result)
+
+        todo = [paths[i] for i in pending]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(todo)))
+
+        if workers == 1:
+            _report_results(todo, map(_analyze_track_safe, todo), pending, on_result)
+        else:
+            # Decode threads overlap file I/O with the compute processes.
+            with ThreadPoolExecutor(max_workers=2 * workers) as io_pool, ProcessPoolExecutor(
+                max_workers=workers, initializer=_warmup
+            ) as ex:
+                analyzed = _pipeline(todo, io_pool, ex, depth=2 * workers)
+                _report_results(todo, analyzed, pending, on_result)
+    finally:
+        if stream is not None:
+            stream.close()
+
+    if cache_dirty:
+        try:
+            _save_cache(cache_path, cache)
+        except OSError as e:
+            print(f"Could not write analysis cache {cache_path}: {e}")
+
+    if output_json and stream is None:
         output_json.parent.mkdir(parents=True, exist_ok=True)
         with output_json.open("w", encoding="utf-8") as f:
             json.dump(results, f, indent=2)
+    if output_json:
         print(f"\nResults saved to {output_json}")
 
-    return results
+    return results if return_results else []
+
+
+def _report_results(
+    paths: List[Path],
+    analyzed: Iterable[Dict[str, Any]],
+    slots: List[int],
+    on_result: Callable[[int, Dict[str, Any]], None],
+) -> None:
+    """Print one status line per file as results arrive and hand each to ``on_result``."""
+    for audio_path, result, i in zip(paths, analyzed, slots):
+        on_result(i, result)
+        if "error" in result:
+            print(f"✗ {audio_path.name}: {result['error']}")
+        else:
+            print(
+                f"✓ {audio_path.name}: {result['bpm']} BPM, {result['key']} {result['mode']}"
+            )
@@ -7,6 +7,8 @@ import numpy as np
 import soundfile as sf
 import librosa
 
+from .audio_io import load_audio
+
 
 def _scalar_tempo(tempo: Any) -> float:
     """Extract a Python float from a librosa tempo value (numpy 2.0 compat)."""
@@ -35,7 +37,7 @@ class PreprocessingStage:
     def process(self, audio_path: str) -> StageResult:
         """Load audio and compute baseline features."""
         # Load audio
-        audio, sr = librosa.load(audio_path, sr=self.target_sr, mono=True)
+        audio, sr = load_audio(Path(audio_path), target_sr=self.target_sr)
 
         if self.normalize:
             audio = librosa.util.normalize(audio)
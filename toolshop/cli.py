@@ -11,6 +11,7 @@ Subcommands:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Sequence
@@ -20,17 +21,10 @@ _repo_root = Path(__file__).resolve().parent.parent
 if (_repo_root / "mastering_tool").is_dir() and str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
 
-from . import suno_adapter
-from . import bpm_adapter
-from . import yt_scraper_adapter
-from . import yt_summarizer_adapter
+# Adapters that pull in librosa, numpy, yt-dlp, etc. are imported inside the
+# branch of main() that uses them so --help and light commands start fast.
 from . import reverse_engineering_adapter
-from . import voice_effects_adapter
-from mastering_tool.tools.vocal_doctor import diagnose_and_recommend
-from . import stem_extractor_adapter
-from . import cleaning_pipeline_adapter
-from . import doctor as doctor_module
-from . import remix_cli
+from . import yt_scraper_adapter
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -86,6 +80,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path("suno_library"),
         help="Root directory of the local Suno library.",
     )
+    list_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every metadata file instead of reusing the metadata cache.",
+    )
 
     # suno analyze - batch BPM/key analysis of Suno library
     suno_analyze_parser = suno_subparsers.add_parser(
@@ -133,6 +132,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to plain-text export file (default: <root>/lyrics_export.txt)",
     )
+    suno_export_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every metadata file instead of reusing the metadata cache.",
+    )
 
     # =========================================================================
     # ANALYZE (BPM/KEY) COMMANDS
@@ -151,6 +155,16 @@ def build_parser() -> argparse.ArgumentParser:
         "file", type=Path, help="Path to audio file (WAV recommended)"
     )
     bpm_file_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    bpm_file_parser.add_argument(
+        "--precise-key",
+        action="store_true",
+        help="Estimate key from a CQT chroma (slower) instead of STFT chroma",
+    )
+    bpm_file_parser.add_argument(
+        "--bpm-only",
+        action="store_true",
+        help="Only estimate tempo (skips beat grid and key; several times faster)",
+    )
 
     # analyze library <root>
     bpm_lib_parser = analyze_subparsers.add_parser(
@@ -167,7 +181,18 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         type=Path,
         default=None,
-        help="Output JSON file for results",
+        help="Output file for results (.ndjson streams one line per file)",
+    )
+    bpm_lib_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel analysis processes (default: 1; 0 = CPU count).",
+    )
+    bpm_lib_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every file instead of reusing the analysis cache.",
     )
 
     # =========================================================================
@@ -295,6 +320,23 @@ def build_parser() -> argparse.ArgumentParser:
         default="advanced",
         help="Analysis backend to use (advanced uses wav_reverse_engineer)",
     )
+    track_analyze_parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Only analyze the first N seconds (default: whole file)",
+    )
+    track_analyze_parser.add_argument(
+        "--sr",
+        type=int,
+        default=22050,
+        help="Analysis sample rate (default: 22050; 16000 is faster)",
+    )
+    track_analyze_parser.add_argument(
+        "--precise-key",
+        action="store_true",
+        help="Basic backend: estimate key from a CQT chroma (slower) instead of STFT chroma",
+    )
     track_analyze_parser.add_argument(
         "--summary", action="store_true", help="Print human-readable summary"
     )
@@ -344,6 +386,24 @@ def build_parser() -> argparse.ArgumentParser:
         default="advanced",
         help="Analysis backend",
     )
+    track_batch_parser.add_argument(
+        "--duration",
+        type=float,
+        default=60.0,
+        help="Only analyze the first N seconds of each file (default: 60; 0 = whole file)",
+    )
+    track_batch_parser.add_argument(
+        "--sr",
+        type=int,
+        default=22050,
+        help="Analysis sample rate (default: 22050; 16000 is faster)",
+    )
+    track_batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Files to analyze in parallel worker processes (default: 1; 0 = CPU count)",
+    )
 
     # track yt-analyze <url>
     track_yt_parser = track_subparsers.add_parser(
@@ -433,6 +493,12 @@ def build_parser() -> argparse.ArgumentParser:
     voice_analyze_parser.add_argument(
         "--output-dir", type=Path, default=None, help="Output directory for JSON export"
     )
+    voice_analyze_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel detector processes (default: 1; 0 = CPU count).",
+    )
 
     # voice doctor <file> [--emit-chain out.yaml]
     voice_doctor_parser = voice_subparsers.add_parser(
@@ -1403,7 +1469,16 @@ def _print_doctor_summary(result: dict) -> None:
     print("=" * 60)
 
 
+def _data_root() -> Path:
+    default = Path(__file__).resolve().parent.parent / "data" / "toolshop"
+    return Path(os.environ.get("TOOLSHOP_DATA_DIR", str(default)))
+
+
 def main(argv: Optional[Sequence[str]] = None) -> None:
+    # Persist numba's compiled kernels across runs; must be set before the
+    # adapters below first import librosa (and so numba).
+    os.environ.setdefault("NUMBA_CACHE_DIR", str(_data_root() / "numba_cache"))
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -1411,6 +1486,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # SUNO
     # =========================================================================
     if args.command == "suno":
+        from . import bpm_adapter, suno_adapter
+
         if args.suno_command == "sync-liked":
             suno_adapter.sync_liked(
                 output_dir=args.output_dir,
@@ -1419,7 +1496,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 max_workers=args.workers,
             )
         elif args.suno_command == "list":
-            suno_adapter.list_library(root=args.root)
+            suno_adapter.list_library(root=args.root, use_cache=not args.no_cache)
         elif args.suno_command == "analyze":
             extensions = [e.strip() for e in args.ext.split(",")]
             output_json = args.output or (args.root / "bpm_key_analysis.json")
@@ -1439,6 +1516,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 root=args.root,
                 output_json=json_out,
                 output_txt=txt_out,
+                use_cache=not args.no_cache,
             )
         else:
             parser.error("Unknown 'suno' subcommand.")
@@ -1447,14 +1525,20 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # ANALYZE (BPM/KEY)
     # =========================================================================
     elif args.command == "analyze":
+        from . import bpm_adapter
+
         if args.analyze_command == "bpm-key":
-            result = bpm_adapter.analyze_track(args.file)
+            if args.bpm_only:
+                result = bpm_adapter.analyze_track_bpm_only(args.file)
+            else:
+                result = bpm_adapter.analyze_track(args.file, precise_key=args.precise_key)
             if args.json:
                 print(json.dumps(result, indent=2))
             else:
                 print(f"File: {result['file']}")
                 print(f"BPM: {result['bpm']}")
-                print(f"Key: {result['key']} {result['mode']}")
+                if "key" in result:
+                    print(f"Key: {result['key']} {result['mode']}")
                 print(f"Duration: {result['duration_seconds']}s")
         elif args.analyze_command == "library":
             extensions = [e.strip() for e in args.ext.split(",")]
@@ -1462,6 +1546,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 root=args.root,
                 extensions=extensions,
                 output_json=args.output,
+                workers=args.workers or None,
+                use_cache=not args.no_cache,
             )
         else:
             parser.error("Unknown 'analyze' subcommand.")
@@ -1470,6 +1556,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # YOUTUBE
     # =========================================================================
     elif args.command == "yt":
+        from . import bpm_adapter, yt_summarizer_adapter
+
         if args.yt_command == "search":
             results = yt_scraper_adapter.search(args.query, limit=args.limit)
             if args.json:
@@ -1549,6 +1637,9 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 notes=args.notes,
                 separation=args.separation,
                 backend=args.backend,
+                duration=args.duration,
+                target_sr=args.sr,
+                precise_key=args.precise_key,
             )
             if args.summary:
                 reverse_engineering_adapter.print_summary(result)
@@ -1571,21 +1662,18 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                     f"No audio files found in {args.directory} with extensions {extensions}"
                 )
 
-            results = []
-            for audio_path in files:
-                try:
-                    result = reverse_engineering_adapter.analyze_track(
-                        path=audio_path,
-                        effects=args.effects,
-                        instruments=args.instruments,
-                        chords=args.chords,
-                        notes=args.notes,
-                        separation=args.separation,
-                        backend=args.backend,
-                    )
-                    results.append(result)
-                except Exception as exc:
-                    results.append({"file": str(audio_path), "error": str(exc)})
+            results = reverse_engineering_adapter.analyze_tracks(
+                files,
+                workers=args.workers or None,
+                effects=args.effects,
+                instruments=args.instruments,
+                chords=args.chords,
+                notes=args.notes,
+                separation=args.separation,
+                backend=args.backend,
+                duration=args.duration or None,
+                target_sr=args.sr,
+            )
 
             batch_report = {
                 "directory": str(args.directory),
@@ -1662,17 +1750,21 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # VOICE EFFECTS ANALYSIS
     # =========================================================================
     elif args.command == "voice":
+        from . import voice_effects_adapter
+
         if args.voice_command == "analyze":
             result = voice_effects_adapter.analyze_voice(
                 path=args.file,
                 export_json=args.export_json,
                 output_dir=args.output_dir,
+                workers=args.workers or None,
             )
             if args.json:
                 print(json.dumps(result, indent=2, default=str))
             else:
                 voice_effects_adapter.print_voice_summary(result)
         elif args.voice_command == "doctor":
+            from mastering_tool.tools.vocal_doctor import diagnose_and_recommend
             result = diagnose_and_recommend(args.file)
             if args.emit_chain:
                 chain = result["chain"]
@@ -1689,6 +1781,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # STEM EXTRACTOR
     # =========================================================================
     elif args.command == "stem":
+        from . import stem_extractor_adapter
+
         if args.stem_command == "extract":
             result = stem_extractor_adapter.extract_stems(
                 input_file=args.file,
@@ -1723,6 +1817,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # CLEANING COMMANDS
     # =========================================================================
     elif args.command == "clean":
+        from . import cleaning_pipeline_adapter
+
         if args.clean_command == "pipeline":
             config = None
             if args.config:
@@ -1912,6 +2008,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # REMIX / SAMPLE FORGE
     # =========================================================================
     elif args.command == "remix":
+        from . import remix_cli
+
         code = remix_cli.run(args)
         if code != 0:
             raise SystemExit(code)
@@ -1920,6 +2018,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     # DOCTOR
     # =========================================================================
     elif args.command == "doctor":
+        from . import doctor as doctor_module
+
         code = doctor_module.main(["--json", str(args.json)] if args.json else [])
         if code != 0:
             raise SystemExit(code)
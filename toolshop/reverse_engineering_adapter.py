@@ -7,9 +7,12 @@ to pure librosa-based analysis otherwise.
 from __future__ import annotations
 
 import json
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     from wav_reverse_engineer.audio_analyzer.audio_processor import AudioProcessor
@@ -37,6 +40,11 @@ except Exception:
     separate_hpss = None
 
 
+_N_FFT = 2048
+_HOP_LENGTH = 512
+_EPS = 1e-10
+
+
 def _to_scalar(x):
     """Convert a numpy scalar/array or Python scalar to a plain Python scalar."""
     if hasattr(x, "item"):
@@ -44,8 +52,25 @@ def _to_scalar(x):
     return x
 
 
-def _basic_analysis(path: Path) -> Dict[str, Any]:
-    """Fallback basic analysis using librosa directly."""
+def _basic_analysis(
+    path: Path,
+    duration: Optional[float] = None,
+    target_sr: int = 22050,
+    precise_key: bool = False,
+    block_seconds: float = 30.0,
+) -> Dict[str, Any]:
+    """Fallback basic analysis using librosa directly.
+
+    ``duration`` caps how many seconds are decoded; tempo, key, centroid and
+    HPSS ratios are stable well inside the first minute of a song, so long
+    files do not need to be analysed end to end. ``precise_key`` uses a CQT
+    chroma of the harmonic signal instead of the STFT chroma.
+
+    Audio is streamed in ``block_seconds`` blocks so memory stays bounded on
+    long mixes: per-frame features are summed per block and averaged at the
+    end, and only the small onset envelope is kept whole for beat tracking.
+    HPSS runs per block, so there are minor edge effects at block boundaries.
+    """
     try:
         import librosa
         import numpy as np
@@ -54,38 +79,92 @@ def _basic_analysis(path: Path) -> Dict[str, Any]:
             "librosa is required. Install with: pip install librosa numpy"
         )
 
-    y, sr = librosa.load(str(path), sr=22050, mono=True)
-    duration = librosa.get_duration(y=y, sr=sr)
+    from .audio_io import audio_duration, fft_workers, iter_audio_blocks
+    from .bpm_adapter import chroma_from_power, estimate_key
+
+    sr = target_sr
+    n_fft, hop_length = _N_FFT, _HOP_LENGTH
+    n_samples = 0
+    n_frames = 0
+    onset_blocks = []
+    chroma_sum = np.zeros(12)
+    centroid_sum = 0.0
+    bandwidth_sum = 0.0
+    harm_energy = 0.0
+    perc_energy = 0.0
+    tuning = None
+    # float32 bin frequencies keep centroid/bandwidth from upcasting to float64
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft).astype(np.float32)
+
+    with fft_workers():
+        for y in iter_audio_blocks(
+            path, target_sr=sr, duration=duration, block_seconds=block_seconds
+        ):
+            n_samples += len(y)
+            if len(y) < n_fft:
+                continue
+
+            # One STFT feeds HPSS, beat tracking, chroma and the spectral features.
+            D = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
+            S = np.abs(D)
+            H, P = librosa.decompose.hpss(D)
+            n_frames += S.shape[1]
+
+            # Onset envelope from the percussive component
+            mel_perc = librosa.feature.melspectrogram(S=np.abs(P) ** 2, sr=sr)
+            onset_blocks.append(
+                librosa.onset.onset_strength(S=librosa.power_to_db(mel_perc), sr=sr)
+            )
+
+            # Chroma from the harmonic component
+            if precise_key:
+                y_harm = librosa.istft(H, hop_length=hop_length, length=len(y))
+                chroma = librosa.feature.chroma_cqt(y=y_harm, sr=sr)
+            else:
+                # Tuning is estimated on the first block and reused after.
+                chroma, tuning = chroma_from_power(np.abs(H) ** 2, sr, n_fft=n_fft, tuning=tuning)
+            chroma_sum += chroma.sum(axis=1)
+
+            # Spectral features; bandwidth reuses the centroid
+            centroid = librosa.feature.spectral_centroid(S=S, sr=sr, freq=freqs)
+            bandwidth = librosa.feature.spectral_bandwidth(
+                S=S, sr=sr, freq=freqs, centroid=centroid
+            )
+            centroid_sum += float(centroid.sum())
+            bandwidth_sum += float(bandwidth.sum())
+
+            # Harmonic/percussive energy (spectral; same ratio as time domain by
+            # Parseval). vdot is a single BLAS reduction with no temporaries.
+            harm_energy += float(np.vdot(H, H).real)
+            perc_energy += float(np.vdot(P, P).real)
+
+    frames = max(n_frames, 1)
+    analyzed_seconds = n_samples / sr
+    # With a cap, report the file's real length as well as what was analyzed.
+    duration_seconds = analyzed_seconds if duration is None else audio_duration(path)
 
     # BPM
-    tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
+    onset_env = np.concatenate(onset_blocks) if onset_blocks else np.zeros(1)
+    tempo, beat_frames = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
     tempo = _to_scalar(tempo)
     beat_count = len(beat_frames) if hasattr(beat_frames, "__len__") else int(_to_scalar(beat_frames))
 
     # Key
-    chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
-    chroma_mean = np.mean(chroma, axis=1)
-    key_idx = int(_to_scalar(np.argmax(chroma_mean)))
-    keys = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-
-    # Spectral features
-    spectral_centroid = float(_to_scalar(np.mean(librosa.feature.spectral_centroid(y=y, sr=sr))))
-    spectral_bandwidth = float(_to_scalar(np.mean(librosa.feature.spectral_bandwidth(y=y, sr=sr))))
+    key, mode = estimate_key(chroma_sum / frames)
 
-    # Harmonic/percussive ratio
-    y_harm, y_perc = librosa.effects.hpss(y)
-    harm_energy = float(_to_scalar(np.mean(y_harm**2)))
-    perc_energy = float(_to_scalar(np.mean(y_perc**2)))
-    harmonic_ratio = harm_energy / (harm_energy + perc_energy + 1e-10)
+    spectral_centroid = centroid_sum / frames
+    spectral_bandwidth = bandwidth_sum / frames
+    harmonic_ratio = harm_energy / (harm_energy + perc_energy + _EPS)
 
     return {
         "file": str(path),
-        "duration_seconds": round(duration, 2),
+        "duration_seconds": round(duration_seconds, 2),
+        "analyzed_seconds": round(analyzed_seconds, 2),
         "sample_rate": sr,
         "bpm": round(float(tempo), 2),
         "beat_count": beat_count,
-        "key": keys[key_idx],
-        "mode": "major" if chroma_mean[key_idx] > 0.5 else "minor",
+        "key": key,
+        "mode": mode,
         "spectral_centroid": round(spectral_centroid, 2),
         "spectral_bandwidth": round(spectral_bandwidth, 2),
         "harmonic_ratio": round(harmonic_ratio, 4),
@@ -100,17 +179,27 @@ def _advanced_analysis(
     chords: bool = False,
     notes: bool = False,
     separation: Optional[str] = None,
+    duration: Optional[float] = None,
+    target_sr: int = 22050,
 ) -> Dict[str, Any]:
     """Analyze a track using the external wav_reverse_engineer package."""
     if AudioProcessor is None or FeatureExtractor is None:
         raise RuntimeError("wav_reverse_engineer is not available")
 
-    audio, sr = AudioProcessor.load_audio(str(path), target_sr=22050, mono=True)
+    audio, sr = AudioProcessor.load_audio(str(path), target_sr=target_sr, mono=True)
+    total_seconds = None
+    if duration is not None:
+        total_seconds = len(audio) / sr
+        audio = audio[: int(duration * sr)]
     features = FeatureExtractor.extract_features(audio, sr)
+    analyzed_seconds = float(features["duration"])
+    if total_seconds is None:
+        total_seconds = analyzed_seconds
 
     result: Dict[str, Any] = {
         "file": str(path),
-        "duration_seconds": round(float(features["duration"]), 2),
+        "duration_seconds": round(total_seconds, 2),
+        "analyzed_seconds": round(analyzed_seconds, 2),
         "sample_rate": sr,
         "bpm": round(float(features["tempo"]), 2),
         "beat_count": int(features["beat_count"]),
@@ -179,6 +268,9 @@ def analyze_track(
     notes: bool = False,
     separation: Optional[str] = None,
     backend: str = "advanced",
+    duration: Optional[float] = None,
+    target_sr: int = 22050,
+    precise_key: bool = False,
 ) -> Dict[str, Any]:
     """Analyze a track for structure, key, BPM, and other musical features.
 
@@ -195,6 +287,13 @@ def analyze_track(
         notes: Run note transcription.
         separation: Source separation backend (hpss).
         backend: 'advanced' to use wav_reverse_engineer, 'basic' for librosa only.
+        duration: Only analyze the first ``duration`` seconds (default: whole
+            file). 60s keeps tempo/key/spectral estimates stable while making
+            cost independent of track length. ``duration_seconds`` stays the
+            full track length; ``analyzed_seconds`` is the part analyzed.
+        target_sr: Analysis sample rate (default 22050).
+        precise_key: Basic backend only: estimate key from a CQT chroma of
+            the harmonic signal (slower) instead of the STFT chroma.
 
     Returns:
         Dict with analysis results.
@@ -212,12 +311,18 @@ def analyze_track(
                 chords=chords,
                 notes=notes,
                 separation=separation,
+                duration=duration,
+                target_sr=target_sr,
             )
         except Exception as exc:
             warnings.warn(f"Advanced analysis failed ({exc}); falling back to basic librosa.")
-            result = _basic_analysis(path)
+            result = _basic_analysis(
+                path, duration=duration, target_sr=target_sr, precise_key=precise_key
+            )
     else:
-        result = _basic_analysis(path)
+        result = _basic_analysis(
+            path, duration=duration, target_sr=target_sr, precise_key=precise_key
+        )
 
     # Export JSON if requested
     if export_json:
@@ -232,6 +337,43 @@ def analyze_track(
     return result
 
 
+def _analyze_track_safe(path: Path, **kwargs: Any) -> Dict[str, Any]:
+    """Run :func:`analyze_track`, returning an error record instead of raising.
+
+    Top-level so it can be pickled into worker processes; one unreadable file
+    must not abort the rest of the batch.
+    """
+    try:
+        return analyze_track(path, **kwargs)
+    except Exception as exc:
+        return {"file": str(path), "error": str(exc)}
+
+
+def analyze_tracks(
+    paths: List[Path], workers: Optional[int] = 1, **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """Analyze several tracks, one file per worker process.
+
+    Args:
+        paths: Audio files to analyze.
+        workers: Worker processes; None uses the CPU count and 1 runs
+            in-process.
+        **kwargs: Passed to :func:`analyze_track` for every file.
+
+    Returns:
+        One result dict per path, in order; failures yield an
+        ``{"file", "error"}`` record.
+    """
+    analyze = partial(_analyze_track_safe, **kwargs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    if workers == 1:
+        return [analyze(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze, paths))
+
+
 def print_summary(result: Dict[str, Any]) -> None:
     """Print a human-readable summary of analysis results."""
     print("\n=== Track Analysis Summary ===")
@@ -1,6 +1,300 @@
+import hashlib
 import json
+import mmap
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes directly and is several times faster than stdlib json
+# on the small per-clip metadata documents.
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers reuse their buffers across documents but are not
+# thread-safe, so each scan thread keeps its own.
+_parsers = threading.local()
+_MAPPINGS: Tuple[type, ...] = (dict,) if simdjson is None else (dict, simdjson.Object)
+
+
+_CACHE_SUBDIR = "suno_cache"
+# Bump when _project's output changes so stale cache entries are dropped.
+_CACHE_SCHEMA_VERSION = 1
+
+_TOP_LEVEL_FIELDS = (
+    "id",
+    "clip_id",
+    "title",
+    "handle",
+    "display_name",
+    "display_tags",
+    "created_at",
+    "is_liked",
+)
+_NESTED_FIELDS = ("prompt", "tags", "duration")
+# Top-level fields copied into each export_text record, in unpack order.
+_SONG_FIELDS = ("id", "title", "handle", "display_name", "display_tags", "created_at")
+
+
+def _plain(value: Any) -> Any:
+    """Materialize a lazy simdjson container; other values pass through."""
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+def _project(data: Any) -> Optional[Dict[str, Any]]:
+    """Keep only the fields read by ``list_library`` and ``export_text``.
+
+    ``data`` may be a dict or a lazy ``simdjson.Object``, in which case only
+    the projected values are converted to Python objects.
+    """
+    if not isinstance(data, _MAPPINGS):
+        return None
+    projected = {k: _plain(data[k]) for k in _TOP_LEVEL_FIELDS if k in data}
+    meta = data.get("metadata")
+    if isinstance(meta, _MAPPINGS):
+        projected["metadata"] = {k: _plain(meta[k]) for k in _NESTED_FIELDS if k in meta}
+    return projected
+
+
+def _parse_metadata(raw: Any) -> Optional[Dict[str, Any]]:
+    if simdjson is None:
+        return _project(_loads(raw))
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    # The lazy document is only valid until this parser's next parse().
+    return _project(parser.parse(raw))
+
+
+# Any document with a top-level ``"is_liked": true`` matches; the parsed
+# value is still checked, so a nested match only costs a full parse.
+_LIKED_RE = re.compile(rb'"is_liked"\s*:\s*true')
+# Stand-in for files the liked-only pre-filter skipped without parsing.
+_UNLIKED: Dict[str, Any] = {"is_liked": False}
+# Shorter files cannot hold {"is_liked":true} and are never opened.
+_MIN_LIKED_BYTES = len(b'{"is_liked":true}')
+
+
+@contextmanager
+def _read_bytes(path: str, size: int) -> Iterator[Any]:
+    """Yield the contents of ``path`` (``size`` bytes, from the scan's stat).
+
+    Files of a page or more are memory-mapped and yielded as a memoryview
+    when orjson or simdjson can parse straight from it (stdlib json cannot);
+    smaller files are read, as the copy is cheaper than the mapping.
+    """
+    with open(path, "rb") as fh:
+        if size < mmap.PAGESIZE or (orjson is None and simdjson is None):
+            yield fh.read()
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            yield view
+
+
+def _load_one(
+    metadata_path: str, size: int, liked_only: bool = False
+) -> Optional[Dict[str, Any]]:
+    try:
+        with _read_bytes(metadata_path, size) as raw:
+            if liked_only and not _LIKED_RE.search(raw):
+                return _UNLIKED
+            return _parse_metadata(raw)
+    except Exception:
+        return None
+
+
+def _data_root() -> Path:
+    default = Path(__file__).resolve().parent.parent / "data" / "toolshop"
+    return Path(os.environ.get("TOOLSHOP_DATA_DIR", str(default)))
+
+
+def _cache_path(root: Path) -> Path:
+    """Cache file for a download root, kept under the data dir, not the library."""
+    key = hashlib.blake2b(str(root.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return _data_root() / _CACHE_SUBDIR / f"{key}.json"
+
+
+def _load_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return cached entries by relative path, or {} if missing/stale/corrupt."""
+    try:
+        with cache_path.open("rb") as fh:
+            data = _loads(fh.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_SCHEMA_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write the cache atomically so an interrupted scan cannot corrupt it."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        json.dump({"version": _CACHE_SCHEMA_VERSION, "entries": entries}, fh, ensure_ascii=False)
+    os.replace(tmp, cache_path)
+
+
+def _dumps_indented(payload: Any) -> bytes:
+    """Serialize ``payload`` as UTF-8 JSON with 2-space indentation."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. lone surrogates in lyrics, which stdlib json tolerates
+            pass
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8", "surrogatepass")
+
+
+def _write_export_json(fh: BinaryIO, root: Path, songs: List[Dict[str, Any]]) -> None:
+    """Write the export payload to ``fh`` one song at a time.
+
+    The bytes match ``json.dump(payload, ensure_ascii=False, indent=2)`` for
+    ``{"root", "total_liked_songs", "songs"}``, without serializing the whole
+    payload into one string first.
+    """
+    fh.write(
+        b'{\n  "root": '
+        + _dumps_indented(str(root))
+        + b',\n  "total_liked_songs": '
+        + str(len(songs)).encode("ascii")
+        + b',\n  "songs": ['
+    )
+    sep = b"\n    "
+    for song in songs:
+        # JSON strings cannot hold raw newlines, so this only re-indents.
+        fh.write(sep + _dumps_indented(song).replace(b"\n", b"\n    "))
+        sep = b",\n    "
+    fh.write(b"\n  ]\n}" if songs else b"]\n}")
+
+
+def _iter_metadata(root: Path) -> Iterator[os.DirEntry]:
+    """Yield a ``DirEntry`` for every ``*_metadata.json`` file under ``root``.
+
+    Walks with ``os.scandir`` so directory checks reuse the cached d_type and
+    callers can ``stat()`` the entry without another path lookup.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith("_metadata.json"):
+                    yield entry
+
+
+def _scan_metadata(root: Path) -> List[os.DirEntry]:
+    """Metadata entries under ``root`` in the order ``sorted(rglob())`` gave."""
+    return sorted(_iter_metadata(root), key=lambda e: e.path.split(os.sep))
+
+
+def _load_metadata(
+    root: Path,
+    metadata_entries: List[os.DirEntry],
+    use_cache: bool = True,
+    liked_only: bool = False,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Read and parse ``metadata_entries`` concurrently, keeping their order.
+
+    Returns ``(relative_path, data)`` pairs, where ``relative_path`` is
+    relative to ``root`` and uses the platform separator. Paths stay plain
+    strings throughout; no ``Path`` is built per file.
+
+    Parsed fields are cached under ``<TOOLSHOP_DATA_DIR>/suno_cache/`` (one
+    file per root) keyed by relative path and validated against each file's
+    size and mtime, so only new or changed files are re-read on later scans.
+    Unreadable or malformed files are dropped.
+
+    With ``liked_only``, files whose raw bytes contain no ``"is_liked": true``
+    (or whose stat size is too small to) are not parsed and come back as
+    ``{"is_liked": False}``; such partial cache entries are re-read by a
+    later full scan.
+    """
+    if not metadata_entries:
+        return []
+    # Entries come from scandir(str(root)), so each path starts with the root
+    # string; slicing it off avoids a relative_to() per file.
+    prefix_len = len(os.path.join(os.fspath(root), ""))
+    rel_paths = [entry.path[prefix_len:] for entry in metadata_entries]
+    keys = rel_paths if os.sep == "/" else [rel.replace(os.sep, "/") for rel in rel_paths]
+
+    cache_path = _cache_path(root)
+    cache = _load_cache(cache_path) if use_cache else {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    parsed: List[Optional[Dict[str, Any]]] = [None] * len(metadata_entries)
+    partial = [False] * len(metadata_entries)
+    misses: List[int] = []
+    stamps: List[Optional[Tuple[int, int]]] = [None] * len(metadata_entries)
+
+    for i, entry in enumerate(metadata_entries):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        stamps[i] = (st.st_mtime_ns, st.st_size)
+        hit = cache.get(keys[i])
+        if (
+            hit
+            and hit.get("mtime") == st.st_mtime_ns
+            and hit.get("size") == st.st_size
+            and (liked_only or not hit.get("partial"))
+        ):
+            parsed[i] = hit.get("parsed")
+            partial[i] = bool(hit.get("partial"))
+        elif liked_only and st.st_size < _MIN_LIKED_BYTES:
+            parsed[i], partial[i] = _UNLIKED, True
+        else:
+            misses.append(i)
+
+    if misses:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            loaded = pool.map(
+                lambda i: _load_one(metadata_entries[i].path, stamps[i][1], liked_only),
+                misses,
+            )
+            for i, data in zip(misses, loaded):
+                parsed[i] = data
+                partial[i] = data is _UNLIKED
+
+    if use_cache:
+        for key, stamp, data, skipped in zip(keys, stamps, parsed, partial):
+            if stamp is not None and data is not None:
+                entry = {"mtime": stamp[0], "size": stamp[1], "parsed": data}
+                if skipped:
+                    entry["partial"] = True
+                entries[key] = entry
+        if misses or entries.keys() != cache.keys():
+            try:
+                _save_cache(cache_path, entries)
+            except OSError as e:
+                print(f"Could not write metadata cache {cache_path}: {e}")
+
+    return [(rel, data) for rel, data in zip(rel_paths, parsed) if data is not None]
 
 
 def sync_liked(
@@ -23,115 +317,109 @@ def sync_liked(
     )
 
 
-def list_library(root: Path) -> None:
-    """List tracks from a local Suno library by scanning metadata JSON files."""
+def list_library(root: Path, use_cache: bool = True) -> None:
+    """List tracks from a local Suno library by scanning metadata JSON files.
+
+    With ``use_cache`` the parsed metadata is reused across runs for files
+    whose size and mtime are unchanged.
+    """
     if not root.exists():
         print(f"No Suno library found at {root}")
         return
 
-    metadata_files: Iterable[Path] = sorted(root.rglob("*_metadata.json"))
-    found_any = False
-
-    for metadata_path in metadata_files:
-        try:
-            with metadata_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except Exception:
-            continue
+    metadata_entries = _scan_metadata(root)
+    rows: List[str] = []
 
+    for rel_path, data in _load_metadata(root, metadata_entries, use_cache=use_cache):
         title = data.get("title") or "Untitled"
-        clip_id = data.get("id") or data.get("clip_id") or metadata_path.stem
-        date_folder = metadata_path.parent.relative_to(root)
-        print(f"{clip_id}\t{date_folder}\t{title}")
-        found_any = True
+        date_folder, name = os.path.split(rel_path)
+        # Same as Path.stem: the file name without ".json".
+        clip_id = data.get("id") or data.get("clip_id") or name[: -len(".json")]
+        date_folder = date_folder or "."
+        rows.append(f"{clip_id}\t{date_folder}\t{title}")
 
-    if not found_any:
+    if not rows:
         print(f"No metadata JSON files found under {root}")
+        return
+    # One write instead of a print (and line-buffered flush) per track.
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 def export_text(
     root: Path,
     output_json: Path,
     output_txt: Optional[Path] = None,
+    use_cache: bool = True,
 ) -> None:
     """Export lyrics and descriptions from liked Suno tracks.
 
     Scans all ``*_metadata.json`` files under ``root``, filters to clips where
     ``is_liked`` is true, and writes a JSON file containing one entry per
     track, sorted by handle then title. Optionally also writes a plain-text
-    export that concatenates all lyrics and descriptions.
+    export that concatenates all lyrics and descriptions. ``use_cache`` is as
+    for :func:`list_library`.
     """
     if not root.exists():
         print(f"No Suno library found at {root}")
         return
 
-    metadata_files: Iterable[Path] = sorted(root.rglob("*_metadata.json"))
-    songs: List[Dict[str, Any]] = []
-
-    for metadata_path in metadata_files:
-        try:
-            with metadata_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except Exception:
-            continue
+    metadata_entries = _scan_metadata(root)
+    keyed: List[Tuple[Tuple[str, str], Dict[str, Any]]] = []
 
+    loaded = _load_metadata(root, metadata_entries, use_cache=use_cache, liked_only=True)
+    for rel_path, data in loaded:
         if not data.get("is_liked", False):
             # Only keep liked tracks, as requested.
             continue
 
+        clip_id, title, handle, display_name, display_tags, created_at = map(
+            data.get, _SONG_FIELDS
+        )
         meta = data.get("metadata") or {}
-        lyrics = meta.get("prompt") or ""
-        description = meta.get("tags") or ""
-
         song: Dict[str, Any] = {
-            "id": data.get("id"),
-            "title": data.get("title"),
-            "handle": data.get("handle"),
-            "display_name": data.get("display_name"),
-            "display_tags": data.get("display_tags"),
-            "created_at": data.get("created_at"),
+            "id": clip_id,
+            "title": title,
+            "handle": handle,
+            "display_name": display_name,
+            "display_tags": display_tags,
+            "created_at": created_at,
             "duration": meta.get("duration"),
-            "lyrics": lyrics,
-            "description": description,
-            "metadata_path": str(metadata_path.relative_to(root)),
+            "lyrics": meta.get("prompt") or "",
+            "description": meta.get("tags") or "",
+            "metadata_path": rel_path,
         }
-        songs.append(song)
+        # Group/sort by handle then title for easier navigation.
+        keyed.append((((handle or "").lower(), (title or "").lower()), song))
 
-    # Group/sort by handle then title for easier navigation.
-    songs.sort(
-        key=lambda s: (
-            (s.get("handle") or "").lower(),
-            (s.get("title") or "").lower(),
-        )
-    )
+    keyed.sort(key=itemgetter(0))
+    songs = [song for _, song in keyed]
 
     output_json.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "root": str(root),
-        "total_liked_songs": len(songs),
-        "songs": songs,
-    }
-    with output_json.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, ensure_ascii=False, indent=2)
+    with output_json.open("wb") as fh:
+        _write_export_json(fh, root, songs)
 
     if output_txt is not None:
+        parts: List[str] = []
+        add = parts.append
+        for song in songs:
+            # Every song dict carries all fields; unpack them once.
+            header = ((song["handle"] or "") + " - " + (song["title"] or "")).strip(" -")
+            description = song["description"]
+            lyrics = song["lyrics"]
+            add(f"# {header}\n")
+
+            if description:
+                add("[DESCRIPTION]\n")
+                add(description.strip() + "\n\n")
+
+            if lyrics:
+                add("[LYRICS]\n")
+                add(lyrics.strip() + "\n")
+
+            add("\n---\n\n")
+
         output_txt.parent.mkdir(parents=True, exist_ok=True)
-        with output_txt.open("w", encoding="utf-8") as fh_txt:
-            for song in songs:
-                handle = song.get("handle") or ""
-                title = song.get("title") or ""
-                header = (handle + " - " + title).strip(" -")
-                fh_txt.write(f"# {header}\n")
-
-                if song.get("description"):
-                    fh_txt.write("[DESCRIPTION]\n")
-                    fh_txt.write(song["description"].strip() + "\n\n")
-
-                if song.get("lyrics"):
-                    fh_txt.write("[LYRICS]\n")
-                    fh_txt.write(song["lyrics"].strip() + "\n")
-
-                fh_txt.write("\n---\n\n")
+        output_txt.write_text("".join(parts), encoding="utf-8")
 
     print(f"Exported {len(songs)} liked tracks to {output_json}")
     if output_txt is not None:
@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .audio_io import load_audio
+
 try:
     import librosa
     import numpy as np
@@ -66,7 +68,7 @@ def _compute_stem_energies(stems_dir: Path, hop_length: int = 512) -> Dict[str,
     energies: Dict[str, List[float]] = {}
     for wav_path in sorted(stems_dir.glob("*.wav")):
         try:
-            y, sr = librosa.load(str(wav_path), sr=22050, mono=True)
+            y, sr = load_audio(wav_path, target_sr=22050)
             rms = librosa.feature.rms(y=y, frame_length=2048, hop_length=hop_length)
             energies[wav_path.stem] = [round(float(v), 6) for v in rms[0, ::50]]
         except Exception:
@@ -96,7 +98,7 @@ def extract_features(
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+    y, sr = load_audio(audio_path, target_sr=22050)
     duration = float(librosa.get_duration(y=y, sr=sr))
 
     tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
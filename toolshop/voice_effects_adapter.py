@@ -6,6 +6,7 @@ were likely applied. Uses only free/open-source libraries:
   - numpy / scipy (signal processing, stats)
   - parselmouth (Praat wrapper - formant analysis, voice quality)
   - crepe (neural pitch detection - optional, enhances pitch-shift detection)
+  - pyfftw (FFTW backend for scipy.fft - optional, faster STFTs)
 
 All detectors are heuristic/statistical — no ML training required.
 Missing optional deps degrade gracefully (detector is skipped).
@@ -13,10 +14,19 @@ Missing optional deps degrade gracefully (detector is skipped).
 
 from __future__ import annotations
 
+import contextlib
 import json
+import numbers
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+from .audio_io import load_audio
 
 # ---------------------------------------------------------------------------
 # Dependency checks
@@ -24,6 +34,7 @@ from typing import Any, Dict, List, Optional, Tuple
 try:
     import librosa
     import numpy as np
+    import scipy.fft
     from scipy import signal as scipy_signal
     from scipy.stats import kurtosis as scipy_kurtosis
 
@@ -46,6 +57,29 @@ try:
 except ImportError:
     _HAS_CREPE = False
 
+try:
+    import threadpoolctl
+except ImportError:
+    threadpoolctl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+
+    _HAS_PYFFTW = True
+except ImportError:
+    _HAS_PYFFTW = False
+
+# Set TOOLSHOP_FFTW=0 to keep scipy's own FFT even when pyfftw is installed.
+_USE_FFTW = _HAS_PYFFTW and os.environ.get("TOOLSHOP_FFTW", "1") != "0"
+# pyfftw.export_wisdom() returns one FFTW wisdom string per precision.
+_FFTW_PRECISIONS = ("double", "single", "longdouble")
+
 
 def _require_librosa() -> None:
     if not _HAS_LIBROSA:
@@ -60,16 +94,60 @@ def _require_librosa() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _fft_backend() -> ContextManager[Any]:
+    """Route ``scipy.fft`` (and so librosa's STFTs) through pyFFTW if enabled."""
+    if not (_USE_FFTW and _HAS_LIBROSA):
+        return contextlib.nullcontext()
+    return scipy.fft.set_backend(pyfftw.interfaces.scipy_fft)
+
+
+def _data_root() -> Path:
+    default = Path(__file__).resolve().parent.parent / "data" / "toolshop"
+    return Path(os.environ.get("TOOLSHOP_DATA_DIR", str(default)))
+
+
+def _load_fftw_wisdom() -> None:
+    """Import FFTW plans saved by a previous run, skipping the plan search."""
+    wisdom_dir = _data_root() / "fftw"
+    try:
+        pyfftw.import_wisdom(
+            tuple((wisdom_dir / f"wisdom_{p}.txt").read_bytes() for p in _FFTW_PRECISIONS)
+        )
+    except Exception:
+        pass
+
+
+def _save_fftw_wisdom() -> None:
+    """Persist the FFTW plans gathered so far; failures are not fatal."""
+    wisdom_dir = _data_root() / "fftw"
+    try:
+        wisdom_dir.mkdir(parents=True, exist_ok=True)
+        for precision, wisdom in zip(_FFTW_PRECISIONS, pyfftw.export_wisdom()):
+            path = wisdom_dir / f"wisdom_{precision}.txt"
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(wisdom)
+            os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+if _USE_FFTW:
+    # Keep pyFFTW's planned objects alive between the many same-size FFTs.
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(30)
+    _load_fftw_wisdom()
+
+
 def _load_audio(path: Path, sr: int = 22050) -> Tuple[Any, int]:
-    """Load audio as mono float32 via librosa."""
+    """Load audio as mono float32 via :func:`toolshop.audio_io.load_audio`."""
     _require_librosa()
-    y, sr_out = librosa.load(str(path), sr=sr, mono=True)
-    return y, sr_out
+    return load_audio(path, target_sr=sr)
 
 
 def _rms_envelope(y: Any, frame_length: int = 2048, hop_length: int = 512) -> Any:
     """Compute RMS energy envelope."""
-    return librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+    rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+    return rms.astype(np.float32, copy=False)
 
 
 def _db(x: float, ref: float = 1.0) -> float:
@@ -77,12 +155,283 @@ def _db(x: float, ref: float = 1.0) -> float:
     return 20.0 * np.log10(max(x, 1e-10) / ref)
 
 
+def _autocorr(x: Any) -> Any:
+    """Non-negative-lag autocorrelation of ``x`` via FFT.
+
+    Same as ``np.correlate(x, x, "full")[len(x) - 1:]`` in O(n log n).
+    """
+    n = len(x)
+    # Any length >= 2n - 1 avoids circular wrap; pick one FFTW/pocketfft
+    # factor well instead of a plain 2n.
+    n_fft = scipy.fft.next_fast_len(2 * n - 1, real=True)
+    spec = scipy.fft.rfft(x, n=n_fft)
+    return scipy.fft.irfft(spec.real**2 + spec.imag**2, n=n_fft)[:n]
+
+
+def _autocorr_range(x: Any, lag_min: int, lag_max: int) -> Any:
+    """Autocorrelation of ``x`` at lags ``lag_min <= lag < lag_max`` only.
+
+    Same values as ``_autocorr(x)[lag_min:lag_max]``, but costs
+    O(n * (lag_max - lag_min)), far less than the full FFT when a detector
+    only needs a short range of lags on a long envelope.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    lag_max = min(lag_max, n)
+    if lag_max <= lag_min:
+        return np.zeros(0)
+    padded = np.concatenate([x, np.zeros(lag_max)])
+    shifted = np.lib.stride_tricks.sliding_window_view(padded, n)[lag_min:lag_max]
+    return shifted @ x
+
+
+def _count_local_maxima(a: Any, lo: int, threshold: float) -> int:
+    """Count strict local maxima above ``threshold`` in ``a[lo:-1]``."""
+    if len(a) < lo + 2:
+        return 0
+    mid = a[lo:-1]
+    return int(np.count_nonzero((mid > a[lo - 1 : -2]) & (mid > a[lo + 1 :]) & (mid > threshold)))
+
+
+def _count_clipped(y: Any, threshold: float) -> int:
+    """Number of samples with ``|y| > threshold``, without an ``abs(y)`` copy."""
+    # Most files never reach the threshold; two reductions settle that.
+    if y.max(initial=0.0) <= threshold and y.min(initial=0.0) >= -threshold:
+        return 0
+    return int(np.count_nonzero(y > threshold)) + int(np.count_nonzero(y < -threshold))
+
+
+def _amp_to_db32(x: Any) -> Any:
+    """``20 * log10(x + 1e-10)`` as float32, in a single new buffer."""
+    out = np.add(x, 1e-10, dtype=np.float32)
+    np.log10(out, out=out)
+    out *= 20.0
+    return out
+
+
+def _linfit_slope(y: Any) -> float:
+    """Slope of the least-squares line through ``(arange(len(y)), y)``.
+
+    Closed form of ``np.polyfit(x, y, 1)[0]`` without the LAPACK solve.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    x = np.arange(n, dtype=np.float64)
+    sx, sy = x.sum(), y.sum()
+    return float((n * np.dot(x, y) - sx * sy) / (n * np.dot(x, x) - sx * sx))
+
+
+def _mean_std(x: Any) -> Tuple[float, float]:
+    """Mean and population std of ``x`` from one sum and one dot product.
+
+    Shifted by the first element so constant input gives an exact zero std.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    n = x.size
+    d = x - x[0]
+    s1 = d.sum()
+    var = max((np.dot(d, d) - s1 * s1 / n) / n, 0.0)
+    return float(x[0] + s1 / n), float(np.sqrt(var))
+
+
+def _decay_slopes(db: Any) -> Tuple[Any, Any]:
+    """Least-squares slope of each row of ``db`` from its peak to the end.
+
+    Returns ``(slopes, valid)``; a row is valid when its tail has more than
+    five frames and is not constant, as ``np.polyfit`` would need.
+    """
+    db = np.asarray(db, dtype=np.float64)
+    idx = np.arange(db.shape[-1])
+    x = idx - np.argmax(db, axis=-1)[:, None]
+    tail = x >= 0
+    n = tail.sum(axis=-1)
+    x = np.where(tail, x, 0)
+    yt = np.where(tail, db, 0.0)
+    sx, sy = x.sum(axis=-1), yt.sum(axis=-1)
+    sxx, sxy = (x * x).sum(axis=-1), (x * yt).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    flat = np.where(tail, db, np.inf).min(axis=-1) == np.where(tail, db, -np.inf).max(axis=-1)
+    return slopes, (n > 5) & ~flat
+
+
+@lru_cache(maxsize=8)
+def _freq_bins(sr: int, n_fft: int) -> Any:
+    """Read-only ``librosa.fft_frequencies`` for ``(sr, n_fft)``."""
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+    freqs.setflags(write=False)
+    return freqs
+
+
+@lru_cache(maxsize=8)
+def _band_slices(sr: int, n_fft: int) -> SimpleNamespace:
+    """Bin slices for the (open) frequency bands the detectors inspect.
+
+    FFT bins are sorted, so each band is a contiguous run of bins and
+    indexing with a slice gives a view where a boolean mask would copy.
+    """
+    freqs = _freq_bins(sr, n_fft)
+    bands = {
+        "voice": (80, 400),
+        "low": (None, 150),
+        "mid": (300, 3000),
+        "high": (8000, None),
+        "below_presence": (1000, 2000),
+        "presence": (2000, 5000),
+        "above_presence": (5000, 8000),
+        "below_sibilant": (2000, 4000),
+        "sibilant": (4000, 9000),
+        "above_sibilant": (9000, 11000),
+    }
+    slices = {}
+    for name, (lo, hi) in bands.items():
+        start = 0 if lo is None else int(np.searchsorted(freqs, lo, side="right"))
+        stop = len(freqs) if hi is None else int(np.searchsorted(freqs, hi, side="left"))
+        slices[name] = slice(start, max(start, stop))
+    return SimpleNamespace(**slices)
+
+
+# Fallback reverb chunks per batched RMS call; bounds the framed buffer.
+_DECAY_BLOCK = 32
+
+
+_N_FFT = 2048
+_HOP_LENGTH = 512
+# pyin hop: two STFT hops (~46 ms at 22.05 kHz). The auto-tune statistics
+# only need a dense sample of the contour, and pyin cost scales with frames.
+_PYIN_HOP_LENGTH = 1024
+# Below these, no detector has anything to measure: skip analysis outright.
+_MIN_DURATION_SECONDS = 0.5
+_SILENCE_RMS = 1e-4
+# Longer inputs are analyzed in overlapping windows to bound peak memory.
+_LONG_AUDIO_SECONDS = 60.0
+_WINDOW_SECONDS = 30.0
+_WINDOW_OVERLAP_SECONDS = 1.0
+
+
+@dataclass
+class FeatureCache:
+    """A signal plus the analysis features shared between detectors.
+
+    Each feature is computed on first access and then reused, so the STFT,
+    RMS envelope and frequency grid are built once per file however many
+    detectors read them.
+    """
+
+    y: Any
+    sr: int
+
+    @cached_property
+    def valid_audio(self) -> bool:
+        """False for clips too short or too quiet to analyze."""
+        if len(self.y) < self.sr * _MIN_DURATION_SECONDS:
+            return False
+        return float(np.sqrt(np.mean(np.square(self.y, dtype=np.float64)))) >= _SILENCE_RMS
+
+    @cached_property
+    def D(self) -> Any:
+        """Complex STFT (n_fft=2048, hop=512)."""
+        return librosa.stft(self.y, n_fft=_N_FFT, hop_length=_HOP_LENGTH, dtype=np.complex64)
+
+    @cached_property
+    def S(self) -> Any:
+        """Magnitude of :attr:`D`."""
+        return np.abs(self.D)
+
+    @cached_property
+    def phase(self) -> Any:
+        return np.angle(self.D)
+
+    @cached_property
+    def freqs(self) -> Any:
+        return _freq_bins(self.sr, _N_FFT)
+
+    @cached_property
+    def rms(self) -> Any:
+        """RMS envelope on the STFT's frame grid."""
+        return _rms_envelope(self.y, frame_length=_N_FFT, hop_length=_HOP_LENGTH)
+
+    @cached_property
+    def rms_db(self) -> Any:
+        """:attr:`rms` in dB (float32), shared by reverb and compression."""
+        return _amp_to_db32(self.rms)
+
+    @cached_property
+    def gate_rms_db(self) -> Any:
+        """Finer RMS envelope (frame 1024, hop 256) in dB, for gate transitions."""
+        return _amp_to_db32(_rms_envelope(self.y, frame_length=1024, hop_length=256))
+
+    @cached_property
+    def centroid(self) -> Any:
+        """Per-frame spectral centroid of :attr:`S`."""
+        return librosa.feature.spectral_centroid(S=self.S, sr=self.sr)[0]
+
+    @cached_property
+    def bandwidth(self) -> Any:
+        """Per-frame spectral bandwidth of :attr:`S`, reusing :attr:`centroid`."""
+        return librosa.feature.spectral_bandwidth(
+            S=self.S, sr=self.sr, centroid=self.centroid[np.newaxis]
+        )[0]
+
+    @cached_property
+    def rolloff(self) -> Any:
+        """Per-frame 85% spectral rolloff of :attr:`S`."""
+        return librosa.feature.spectral_rolloff(S=self.S, sr=self.sr, roll_percent=0.85)[0]
+
+    @cached_property
+    def flatness(self) -> Any:
+        """Per-frame spectral flatness of :attr:`S`."""
+        return librosa.feature.spectral_flatness(S=self.S)[0]
+
+    @cached_property
+    def S_4096(self) -> Any:
+        """Magnitude STFT at n_fft=4096 for finer harmonic resolution."""
+        return np.abs(librosa.stft(self.y, n_fft=4096, dtype=np.complex64))
+
+    @cached_property
+    def freqs_4096(self) -> Any:
+        return _freq_bins(self.sr, 4096)
+
+    @cached_property
+    def formants(self) -> Tuple[Dict[str, float], Any]:
+        """``(medians, tracks)`` from :func:`_get_formants_parselmouth`."""
+        return _get_formants_parselmouth(self.y, self.sr)
+
+    @cached_property
+    def pyin(self) -> Tuple[Any, Any]:
+        """``(f0, voiced_flag)`` from ``librosa.pyin`` over 50-600 Hz.
+
+        pyin dominates the analysis time, so voice detection, pitch-shift
+        and auto-tune detection all read this one contour.
+        """
+        f0, voiced_flag, _ = librosa.pyin(
+            self.y, fmin=50, fmax=600, sr=self.sr,
+            frame_length=_N_FFT, hop_length=_PYIN_HOP_LENGTH,
+        )
+        return f0, voiced_flag
+
+    def prefetch(self) -> None:
+        """Compute every shared feature now, e.g. before pickling to workers."""
+        for name in (
+            "S", "phase", "freqs", "rms", "rms_db", "gate_rms_db", "S_4096", "freqs_4096",
+            "formants",
+        ):
+            getattr(self, name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # S and phase carry everything detectors read from the complex STFT,
+        # so leave it out of the pickle; it is rebuilt if ever accessed.
+        state = dict(self.__dict__)
+        state.pop("D", None)
+        return state
+
+
 # ---------------------------------------------------------------------------
 # Individual effect detectors
 # ---------------------------------------------------------------------------
 
 
-def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
+def detect_reverb(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect reverb by analysing energy decay and spectral smearing.
 
     Approach:
@@ -90,6 +439,7 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
       2. Estimate RT60 (time for 60dB decay) from the slope.
       3. Measure spectral temporal smearing via autocorrelation width.
     """
+    y, sr = ctx.y, ctx.sr
     result: Dict[str, Any] = {
         "effect": "reverb",
         "confidence": 0.0,
@@ -98,8 +448,7 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
     }
 
     # Energy envelope
-    rms = _rms_envelope(y, frame_length=2048, hop_length=512)
-    rms_db = 20.0 * np.log10(rms + 1e-10)
+    rms_db = ctx.rms_db
 
     # Find the last loud segment and measure its decay
     threshold = np.max(rms_db) - 10  # 10dB below peak
@@ -114,24 +463,18 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
         # Segment the signal into chunks and measure average decay tails
         chunk_size = sr  # 1 second chunks
         hop = sr // 2
+        n_chunks = len(range(0, len(y) - chunk_size, hop))
+        chunks = np.lib.stride_tricks.sliding_window_view(y, chunk_size)[::hop][:n_chunks]
         decay_times = []
-        for start in range(0, len(y) - chunk_size, hop):
-            chunk = y[start : start + chunk_size]
-            chunk_rms = _rms_envelope(chunk, frame_length=512, hop_length=128)
-            chunk_db = 20.0 * np.log10(chunk_rms + 1e-10)
-            peak_idx = np.argmax(chunk_db)
-            tail = chunk_db[peak_idx:]
-            if len(tail) > 5:
-                # Linear fit to decay
-                x_axis = np.arange(len(tail))
-                if np.std(tail) > 0:
-                    coeffs = np.polyfit(x_axis, tail, 1)
-                    slope = coeffs[0]  # dB per frame
-                    if slope < -0.01:
-                        frames_per_sec = sr / 128
-                        rt60_est = -60.0 / (slope * frames_per_sec)
-                        if 0.05 < rt60_est < 10.0:
-                            decay_times.append(rt60_est)
+        for block in range(0, n_chunks, _DECAY_BLOCK):
+            chunk_rms = librosa.feature.rms(
+                y=chunks[block : block + _DECAY_BLOCK], frame_length=512, hop_length=128
+            )[:, 0]
+            slopes, valid = _decay_slopes(_amp_to_db32(chunk_rms))
+            slopes = slopes[valid & (slopes < -0.01)]  # dB per frame
+            frames_per_sec = sr / 128
+            rt60_est = -60.0 / (slopes * frames_per_sec)
+            decay_times.extend(rt60_est[(0.05 < rt60_est) & (rt60_est < 10.0)].tolist())
         if decay_times:
             median_rt60 = float(np.median(decay_times))
             result["params"]["estimated_rt60_seconds"] = round(median_rt60, 3)
@@ -146,9 +489,7 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
         return result
 
     # Linear regression on decay curve
-    x_axis = np.arange(len(decay_region))
-    coeffs = np.polyfit(x_axis, decay_region, 1)
-    slope = coeffs[0]  # dB per frame
+    slope = _linfit_slope(decay_region)  # dB per frame
 
     frames_per_sec = sr / 512
     if slope < -0.001:
@@ -169,9 +510,11 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
             result["evidence"].append(f"Minimal decay tail: RT60 ~ {rt60:.2f}s")
 
     # Spectral smearing: compare spectral flux in high freqs
-    S = np.abs(librosa.stft(y))
+    S = ctx.S
     high_band = S[S.shape[0] // 2 :, :]  # Upper half of spectrum
-    spectral_flux = np.mean(np.diff(high_band, axis=1) ** 2)
+    flux = np.diff(high_band, axis=1)
+    np.square(flux, out=flux)  # in place: no second (F/2, T-1) temporary
+    spectral_flux = np.mean(flux)
     if spectral_flux < 0.001:
         result["confidence"] = min(1.0, result["confidence"] + 0.15)
         result["evidence"].append("Low spectral flux in high frequencies (smearing)")
@@ -179,13 +522,14 @@ def detect_reverb(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_pitch_shift(y: Any, sr: int) -> Dict[str, Any]:
+def detect_pitch_shift(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect pitch shifting by comparing F0 with formant positions.
 
     Natural voice: formants scale with vocal tract length, not with pitch.
     Pitch-shifted voice: F0 moves but formants either stay (PSOLA) or
     shift together (naive resampling).
     """
+    y, sr = ctx.y, ctx.sr
     result: Dict[str, Any] = {
         "effect": "pitch_shift",
         "confidence": 0.0,
@@ -213,9 +557,9 @@ def detect_pitch_shift(y: Any, sr: int) -> Dict[str, Any]:
             f0_values = frequency[mask]
             f0_median = float(np.median(f0_values))
         except Exception:
-            f0_median = _librosa_f0(y, sr)
+            f0_median = _librosa_f0(ctx)
     else:
-        f0_median = _librosa_f0(y, sr)
+        f0_median = _librosa_f0(ctx)
 
     if f0_median is None or f0_median < 50:
         return result
@@ -224,7 +568,7 @@ def detect_pitch_shift(y: Any, sr: int) -> Dict[str, Any]:
 
     # Get formants via parselmouth
     if _HAS_PARSELMOUTH:
-        formants = _get_formants_parselmouth(y, sr)
+        formants, _ = ctx.formants
         if formants and formants.get("F1") and formants.get("F2"):
             f1 = formants["F1"]
             f2 = formants["F2"]
@@ -271,10 +615,10 @@ def detect_pitch_shift(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def _librosa_f0(y: Any, sr: int) -> Optional[float]:
-    """Estimate median F0 using librosa's pyin."""
+def _librosa_f0(ctx: FeatureCache) -> Optional[float]:
+    """Estimate median F0 from the cached pyin contour."""
     try:
-        f0, voiced_flag, _ = librosa.pyin(y, fmin=50, fmax=600, sr=sr)
+        f0, voiced_flag = ctx.pyin
         voiced = f0[voiced_flag]
         if len(voiced) < 5:
             return None
@@ -283,56 +627,39 @@ def _librosa_f0(y: Any, sr: int) -> Optional[float]:
         return None
 
 
-def _get_formants_parselmouth(y: Any, sr: int) -> Dict[str, float]:
-    """Extract median formant frequencies using parselmouth (Praat)."""
+# Plausible (low, high) Hz bounds for F1, F2 and F3; frames outside are ignored.
+_FORMANT_RANGES = ((200, 1200), (600, 3500), (1500, 5000))
+
+
+def _get_formants_parselmouth(y: Any, sr: int) -> Tuple[Dict[str, float], Any]:
+    """Extract formants with a single Praat Burg analysis.
+
+    Returns:
+        ``(medians, tracks)``: median F1-F3 in Hz over the frames within
+        ``_FORMANT_RANGES``, and the raw per-frame values as a (3, n_frames)
+        array with NaN where Praat has no value. ``({}, None)`` on failure.
+    """
     try:
         snd = parselmouth.Sound(y, sampling_frequency=sr)
         formant = praat_call(snd, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
-        n_frames = praat_call(formant, "Get number of frames")
-
-        f1_vals, f2_vals, f3_vals = [], [], []
-        for i in range(1, int(n_frames) + 1):
-            f1 = praat_call(
-                formant,
-                "Get value at time",
-                1,
-                praat_call(formant, "Get time from frame number", i),
-                "hertz",
-                "Linear",
-            )
-            f2 = praat_call(
-                formant,
-                "Get value at time",
-                2,
-                praat_call(formant, "Get time from frame number", i),
-                "hertz",
-                "Linear",
-            )
-            f3 = praat_call(
-                formant,
-                "Get value at time",
-                3,
-                praat_call(formant, "Get time from frame number", i),
-                "hertz",
-                "Linear",
-            )
-            if f1 and not np.isnan(f1) and 200 < f1 < 1200:
-                f1_vals.append(f1)
-            if f2 and not np.isnan(f2) and 600 < f2 < 3500:
-                f2_vals.append(f2)
-            if f3 and not np.isnan(f3) and 1500 < f3 < 5000:
-                f3_vals.append(f3)
-
-        result = {}
-        if f1_vals:
-            result["F1"] = round(float(np.median(f1_vals)), 1)
-        if f2_vals:
-            result["F2"] = round(float(np.median(f2_vals)), 1)
-        if f3_vals:
-            result["F3"] = round(float(np.median(f3_vals)), 1)
-        return result
+        # Read frames through the Formant object's own bindings rather than
+        # praat_call: no command-string dispatch, and frame times come as
+        # one array. At a frame's own time, linear interpolation returns that
+        # frame's value, so this equals the old "Get value at time" loop.
+        get = formant.get_value_at_time
+        tracks = np.array(
+            [[get(k, t) for t in formant.ts()] for k in (1, 2, 3)], dtype=float
+        ).reshape(3, -1)
+
+        medians = {}
+        for k, (low, high) in enumerate(_FORMANT_RANGES):
+            track = tracks[k]
+            vals = track[(track > low) & (track < high)]
+            if vals.size:
+                medians[f"F{k + 1}"] = round(float(np.median(vals)), 1)
+        return medians, tracks
     except Exception:
-        return {}
+        return {}, None
 
 
 def _estimate_f0_range_from_formants(f1: float, f2: float) -> Tuple[float, float]:
@@ -353,7 +680,7 @@ def _estimate_f0_range_from_formants(f1: float, f2: float) -> Tuple[float, float
         return (200.0, 400.0)
 
 
-def detect_formant_shift(y: Any, sr: int) -> Dict[str, Any]:
+def detect_formant_shift(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect formant shifting — formants moved independently of pitch.
 
     Formant-shifted voice has formant ratios that deviate from natural
@@ -372,7 +699,7 @@ def detect_formant_shift(y: Any, sr: int) -> Dict[str, Any]:
         )
         return result
 
-    formants = _get_formants_parselmouth(y, sr)
+    formants, tracks = ctx.formants
     if not formants.get("F1") or not formants.get("F2"):
         result["evidence"].append("Could not extract formants reliably")
         return result
@@ -401,28 +728,18 @@ def detect_formant_shift(y: Any, sr: int) -> Dict[str, Any]:
                 f"Unusual F3/F2 ratio: {ratio_f3_f2:.2f} (normal: 1.2-1.8)"
             )
 
-    # Check if formants are unnaturally uniform across time
-    try:
-        snd = parselmouth.Sound(y, sampling_frequency=sr)
-        formant_obj = praat_call(snd, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
-        n_frames = praat_call(formant_obj, "Get number of frames")
-
-        f1_series = []
-        for i in range(1, min(int(n_frames) + 1, 200)):
-            t = praat_call(formant_obj, "Get time from frame number", i)
-            val = praat_call(formant_obj, "Get value at time", 1, t, "hertz", "Linear")
-            if val and not np.isnan(val) and 200 < val < 1200:
-                f1_series.append(val)
-
-        if len(f1_series) > 10:
-            f1_cv = np.std(f1_series) / np.mean(f1_series)  # Coefficient of variation
-            result["params"]["F1_variability_cv"] = round(float(f1_cv), 4)
-            # Very low variability can indicate processing
-            if f1_cv < 0.03:
-                anomaly_score += 0.2
-                result["evidence"].append(f"Unusually stable F1 (CV={f1_cv:.4f})")
-    except Exception:
-        pass
+    # Check if formants are unnaturally uniform across time (first 199 frames)
+    f1_track = tracks[0, :199]
+    low, high = _FORMANT_RANGES[0]
+    f1_series = f1_track[(f1_track > low) & (f1_track < high)]
+    if len(f1_series) > 10:
+        f1_mean, f1_std = _mean_std(f1_series)
+        f1_cv = f1_std / f1_mean  # Coefficient of variation
+        result["params"]["F1_variability_cv"] = round(float(f1_cv), 4)
+        # Very low variability can indicate processing
+        if f1_cv < 0.03:
+            anomaly_score += 0.2
+            result["evidence"].append(f"Unusually stable F1 (CV={f1_cv:.4f})")
 
     result["confidence"] = min(0.95, anomaly_score)
     if not result["evidence"]:
@@ -431,8 +748,9 @@ def detect_formant_shift(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_compression(y: Any, sr: int) -> Dict[str, Any]:
+def detect_compression(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect dynamic range compression via crest factor and RMS analysis."""
+    y = ctx.y
     result: Dict[str, Any] = {
         "effect": "compression",
         "confidence": 0.0,
@@ -440,8 +758,6 @@ def detect_compression(y: Any, sr: int) -> Dict[str, Any]:
         "evidence": [],
     }
 
-    rms = _rms_envelope(y, frame_length=2048, hop_length=512)
-
     # Crest factor: peak / RMS (lower = more compressed)
     peak = float(np.max(np.abs(y)))
     rms_global = float(np.sqrt(np.mean(y**2)))
@@ -455,7 +771,7 @@ def detect_compression(y: Any, sr: int) -> Dict[str, Any]:
     result["params"]["rms_amplitude"] = round(rms_global, 4)
 
     # Dynamic range: difference between loud and quiet sections
-    rms_db = 20.0 * np.log10(rms + 1e-10)
+    rms_db = ctx.rms_db
     # Exclude silence
     non_silent = rms_db[rms_db > np.max(rms_db) - 60]
     if len(non_silent) > 10:
@@ -504,8 +820,9 @@ def detect_compression(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
+def detect_eq(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect EQ / filtering by comparing spectral shape to natural voice reference."""
+    sr = ctx.sr
     result: Dict[str, Any] = {
         "effect": "eq_filtering",
         "confidence": 0.0,
@@ -513,28 +830,27 @@ def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
         "evidence": [],
     }
 
-    S = np.abs(librosa.stft(y))
-    freqs = librosa.fft_frequencies(sr=sr)
+    S = ctx.S
+    freqs = ctx.freqs
+    bands = _band_slices(sr, _N_FFT)
 
     # Average spectral magnitude per frequency bin
     avg_spectrum = np.mean(S, axis=1)
-    avg_spectrum_db = 20.0 * np.log10(avg_spectrum + 1e-10)
+    avg_spectrum_db = _amp_to_db32(avg_spectrum)
 
     # Natural voice reference: roughly -3dB/octave rolloff above ~1kHz
     # Check for anomalous peaks or notches
     spectral_centroid = float(
-        np.sum(freqs * avg_spectrum) / (np.sum(avg_spectrum) + 1e-10)
-    )
-    spectral_rolloff = float(
-        librosa.feature.spectral_rolloff(y=y, sr=sr, roll_percent=0.85).mean()
+        np.dot(freqs, avg_spectrum) / (np.sum(avg_spectrum) + 1e-10)
     )
+    spectral_rolloff = float(ctx.rolloff.mean())
 
     result["params"]["spectral_centroid_hz"] = round(spectral_centroid, 1)
     result["params"]["spectral_rolloff_hz"] = round(spectral_rolloff, 1)
 
     # Check for high-pass filter (missing low frequencies)
-    low_band_energy = float(np.mean(avg_spectrum_db[freqs < 150]))
-    mid_band_energy = float(np.mean(avg_spectrum_db[(freqs > 300) & (freqs < 3000)]))
+    low_band_energy = float(np.mean(avg_spectrum_db[bands.low]))
+    mid_band_energy = float(np.mean(avg_spectrum_db[bands.mid]))
 
     hp_diff = mid_band_energy - low_band_energy
     if hp_diff > 20:
@@ -546,7 +862,7 @@ def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
         )
 
     # Check for low-pass filter (missing highs)
-    high_band_energy = float(np.mean(avg_spectrum_db[freqs > 8000]))
+    high_band_energy = float(np.mean(avg_spectrum_db[bands.high]))
     lp_diff = mid_band_energy - high_band_energy
     # Natural voice drops off, but >30dB is suspicious
     if lp_diff > 35:
@@ -557,11 +873,11 @@ def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
         )
 
     # Check for presence boost (2-5kHz boost common in vocal processing)
-    presence_band = avg_spectrum_db[(freqs > 2000) & (freqs < 5000)]
+    presence_band = avg_spectrum_db[bands.presence]
     surrounding = np.concatenate(
         [
-            avg_spectrum_db[(freqs > 1000) & (freqs < 2000)],
-            avg_spectrum_db[(freqs > 5000) & (freqs < 8000)],
+            avg_spectrum_db[bands.below_presence],
+            avg_spectrum_db[bands.above_presence],
         ]
     )
     if len(presence_band) > 0 and len(surrounding) > 0:
@@ -574,7 +890,7 @@ def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
             )
 
     # Spectral flatness — very flat spectrum suggests heavy EQ or processing
-    flatness = float(librosa.feature.spectral_flatness(y=y).mean())
+    flatness = float(ctx.flatness.mean())
     result["params"]["spectral_flatness"] = round(flatness, 4)
 
     result["confidence"] = min(0.95, result["confidence"])
@@ -584,8 +900,9 @@ def detect_eq(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_distortion(y: Any, sr: int) -> Dict[str, Any]:
+def detect_distortion(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect distortion/saturation via harmonic analysis and THD."""
+    y, sr = ctx.y, ctx.sr
     result: Dict[str, Any] = {
         "effect": "distortion",
         "confidence": 0.0,
@@ -594,14 +911,14 @@ def detect_distortion(y: Any, sr: int) -> Dict[str, Any]:
     }
 
     # Total Harmonic Distortion estimation
-    S = np.abs(librosa.stft(y, n_fft=4096))
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=4096)
+    S = ctx.S_4096
+    freqs = ctx.freqs_4096
     avg_spectrum = np.mean(S, axis=1)
 
     # Find fundamental
     # Focus on voice range 80-400Hz
-    voice_range = (freqs > 80) & (freqs < 400)
-    if not np.any(voice_range):
+    voice_range = _band_slices(sr, 4096).voice
+    if voice_range.start == voice_range.stop:
         return result
 
     fund_idx = np.argmax(avg_spectrum[voice_range])
@@ -613,34 +930,25 @@ def detect_distortion(y: Any, sr: int) -> Dict[str, Any]:
 
     result["params"]["fundamental_hz"] = round(float(fund_freq), 1)
 
-    # Measure harmonics
-    harmonic_amps = []
-    for n in range(2, 9):  # 2nd through 8th harmonic
-        harm_freq = fund_freq * n
-        if harm_freq > sr / 2:
-            break
-        harm_idx = np.argmin(np.abs(freqs - harm_freq))
-        # Search small window around expected position
-        window = 3
-        start = max(0, harm_idx - window)
-        end = min(len(avg_spectrum), harm_idx + window + 1)
-        harm_amp = float(np.max(avg_spectrum[start:end]))
-        harmonic_amps.append(harm_amp)
-
-    if harmonic_amps:
+    # Measure harmonics, 2nd through 8th
+    harm_freqs = fund_freq * np.arange(2, 9)
+    harm_freqs = harm_freqs[harm_freqs <= sr / 2]
+    harm_bins = np.rint(harm_freqs / freqs[1]).astype(np.int64)
+    # Search small window around expected position
+    window = 3
+    idx = np.clip(harm_bins[:, None] + np.arange(-window, window + 1), 0, len(avg_spectrum) - 1)
+    harmonic_amps = avg_spectrum[idx].max(axis=1).astype(np.float64)
+
+    if len(harmonic_amps):
         # THD = sqrt(sum(harmonics^2)) / fundamental
-        thd = float(np.sqrt(np.sum(np.array(harmonic_amps) ** 2)) / fund_amp)
+        thd = float(np.sqrt(np.sum(harmonic_amps ** 2)) / fund_amp)
         thd_percent = thd * 100
         result["params"]["thd_percent"] = round(thd_percent, 2)
 
         # Odd vs even harmonic ratio (tube saturation → even harmonics)
-        odd_amps = [
-            harmonic_amps[i] for i in range(0, len(harmonic_amps), 2)
-        ]  # 2nd,4th,6th = even
-        even_amps = [
-            harmonic_amps[i] for i in range(1, len(harmonic_amps), 2)
-        ]  # 3rd,5th,7th = odd
-        if odd_amps and even_amps:
+        odd_amps = harmonic_amps[0::2]  # 2nd,4th,6th = even
+        even_amps = harmonic_amps[1::2]  # 3rd,5th,7th = odd
+        if odd_amps.size and even_amps.size:
             even_odd_ratio = float(np.mean(odd_amps)) / (
                 float(np.mean(even_amps)) + 1e-10
             )
@@ -664,7 +972,7 @@ def detect_distortion(y: Any, sr: int) -> Dict[str, Any]:
 
     # Clipping detection
     clip_threshold = 0.99
-    clipped_samples = np.sum(np.abs(y) > clip_threshold)
+    clipped_samples = _count_clipped(y, clip_threshold)
     clip_ratio = clipped_samples / len(y)
     if clip_ratio > 0.001:
         result["confidence"] = min(0.95, result["confidence"] + 0.3)
@@ -679,7 +987,7 @@ def detect_distortion(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_chorus(y: Any, sr: int) -> Dict[str, Any]:
+def detect_chorus(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect chorus/doubling via phase coherence and spectral width modulation."""
     result: Dict[str, Any] = {
         "effect": "chorus_doubling",
@@ -689,9 +997,7 @@ def detect_chorus(y: Any, sr: int) -> Dict[str, Any]:
     }
 
     # STFT for phase analysis
-    D = librosa.stft(y)
-    S = np.abs(D)
-    phase = np.angle(D)
+    phase = ctx.phase
 
     # Phase coherence: chorus introduces phase decorrelation
     phase_diff = np.diff(phase, axis=1)
@@ -699,33 +1005,24 @@ def detect_chorus(y: Any, sr: int) -> Dict[str, Any]:
     result["params"]["phase_coherence"] = round(phase_coherence, 4)
 
     # Spectral width modulation: chorus causes periodic spectral broadening
-    spectral_bw = librosa.feature.spectral_bandwidth(S=S, sr=sr)[0]
-    bw_std = float(np.std(spectral_bw))
-    bw_mean = float(np.mean(spectral_bw))
+    spectral_bw = ctx.bandwidth
+    bw_mean, bw_std = _mean_std(spectral_bw)
     bw_cv = bw_std / (bw_mean + 1e-10)
     result["params"]["bandwidth_cv"] = round(bw_cv, 4)
 
     # Chorus typically has LFO modulation (0.1-5Hz)
     if len(spectral_bw) > 20:
         # Check for periodic modulation in bandwidth
-        bw_centered = spectral_bw - np.mean(spectral_bw)
-        autocorr = np.correlate(bw_centered, bw_centered, mode="full")
-        autocorr = autocorr[len(autocorr) // 2 :]
+        bw_centered = spectral_bw - bw_mean
+        autocorr = _autocorr(bw_centered)
         if len(autocorr) > 1:
             autocorr = autocorr / (autocorr[0] + 1e-10)
-            # Look for peaks indicating periodic modulation
-            peaks = []
-            for i in range(2, min(len(autocorr) - 1, 100)):
-                if (
-                    autocorr[i] > autocorr[i - 1]
-                    and autocorr[i] > autocorr[i + 1]
-                    and autocorr[i] > 0.3
-                ):
-                    peaks.append(i)
-            if peaks:
+            # Look for peaks indicating periodic modulation (lags 2-99)
+            n_peaks = _count_local_maxima(autocorr[:101], lo=2, threshold=0.3)
+            if n_peaks:
                 result["confidence"] += 0.3
                 result["evidence"].append(
-                    f"Periodic bandwidth modulation detected ({len(peaks)} peaks)"
+                    f"Periodic bandwidth modulation detected ({n_peaks} peaks)"
                 )
 
     if phase_coherence < 0.7:
@@ -746,7 +1043,7 @@ def detect_chorus(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_autotune(y: Any, sr: int) -> Dict[str, Any]:
+def detect_autotune(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect auto-tune / pitch correction by analyzing F0 contour smoothness.
 
     Auto-tuned vocals have unnaturally stable/quantized pitch contours
@@ -761,7 +1058,7 @@ def detect_autotune(y: Any, sr: int) -> Dict[str, Any]:
 
     # Get F0 contour
     try:
-        f0, voiced_flag, _ = librosa.pyin(y, fmin=50, fmax=600, sr=sr)
+        f0, voiced_flag = ctx.pyin
     except Exception:
         result["evidence"].append("Could not extract pitch contour")
         return result
@@ -837,7 +1134,7 @@ def detect_autotune(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_deessing(y: Any, sr: int) -> Dict[str, Any]:
+def detect_deessing(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect de-essing by looking for energy dips in sibilant frequency range."""
     result: Dict[str, Any] = {
         "effect": "de_essing",
@@ -846,17 +1143,13 @@ def detect_deessing(y: Any, sr: int) -> Dict[str, Any]:
         "evidence": [],
     }
 
-    S = np.abs(librosa.stft(y))
-    freqs = librosa.fft_frequencies(sr=sr)
+    S = ctx.S
+    bands = _band_slices(ctx.sr, _N_FFT)
 
     # Sibilant range: ~4-9kHz
-    sibilant_mask = (freqs > 4000) & (freqs < 9000)
-    below_mask = (freqs > 2000) & (freqs < 4000)
-    above_mask = (freqs > 9000) & (freqs < 11000)
-
-    sib_energy = float(np.mean(S[sibilant_mask, :]))
-    below_energy = float(np.mean(S[below_mask, :]))
-    above_energy = float(np.mean(S[above_mask, :]))
+    sib_energy = float(np.mean(S[bands.sibilant, :]))
+    below_energy = float(np.mean(S[bands.below_sibilant, :]))
+    above_energy = float(np.mean(S[bands.above_sibilant, :]))
 
     if below_energy < 1e-10:
         return result
@@ -876,9 +1169,10 @@ def detect_deessing(y: Any, sr: int) -> Dict[str, Any]:
         result["evidence"].append(f"Moderate sibilant reduction: ratio {sib_ratio:.2f}")
 
     # Check for dynamic de-essing: sibilant energy that's unnaturally consistent
-    sib_envelope = np.mean(S[sibilant_mask, :], axis=0)
+    sib_envelope = np.mean(S[bands.sibilant, :], axis=0)
     if len(sib_envelope) > 10:
-        sib_cv = float(np.std(sib_envelope) / (np.mean(sib_envelope) + 1e-10))
+        sib_mean, sib_std = _mean_std(sib_envelope)
+        sib_cv = sib_std / (sib_mean + 1e-10)
         result["params"]["sibilant_variability_cv"] = round(sib_cv, 4)
         if sib_cv < 0.3:
             result["confidence"] += 0.15
@@ -893,8 +1187,9 @@ def detect_deessing(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_vocoder(y: Any, sr: int) -> Dict[str, Any]:
+def detect_vocoder(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect vocoder processing via spectral envelope regularity."""
+    sr = ctx.sr
     result: Dict[str, Any] = {
         "effect": "vocoder",
         "confidence": 0.0,
@@ -903,7 +1198,8 @@ def detect_vocoder(y: Any, sr: int) -> Dict[str, Any]:
     }
 
     # MFCCs — vocoded voice has very regular/artificial MFCC patterns
-    mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=20)
+    mel = librosa.feature.melspectrogram(S=ctx.S**2, sr=sr)
+    mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=20)
 
     # Check MFCC temporal variance — vocoders create very uniform textures
     mfcc_var = np.var(mfccs, axis=1)
@@ -912,8 +1208,8 @@ def detect_vocoder(y: Any, sr: int) -> Dict[str, Any]:
 
     # Check for carrier signal: vocoders often use sawtooth/synth carriers
     # which create very regular harmonic spacing
-    S = np.abs(librosa.stft(y, n_fft=4096))
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=4096)
+    S = ctx.S_4096
+    freqs = ctx.freqs_4096
     avg_spectrum = np.mean(S, axis=1)
 
     # Measure harmonic regularity
@@ -924,7 +1220,8 @@ def detect_vocoder(y: Any, sr: int) -> Dict[str, Any]:
         peak_freqs = freqs[peaks_idx]
         peak_diffs = np.diff(peak_freqs)
         if len(peak_diffs) > 2:
-            spacing_cv = float(np.std(peak_diffs) / (np.mean(peak_diffs) + 1e-10))
+            spacing_mean, spacing_std = _mean_std(peak_diffs)
+            spacing_cv = spacing_std / (spacing_mean + 1e-10)
             result["params"]["harmonic_spacing_cv"] = round(spacing_cv, 4)
 
             # Very regular spacing = synthetic carrier
@@ -953,7 +1250,7 @@ def detect_vocoder(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_noise_gate(y: Any, sr: int) -> Dict[str, Any]:
+def detect_noise_gate(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect noise gating via abrupt silence transitions."""
     result: Dict[str, Any] = {
         "effect": "noise_gate",
@@ -962,33 +1259,22 @@ def detect_noise_gate(y: Any, sr: int) -> Dict[str, Any]:
         "evidence": [],
     }
 
-    rms = _rms_envelope(y, frame_length=1024, hop_length=256)
-    rms_db = 20.0 * np.log10(rms + 1e-10)
+    rms_db = ctx.gate_rms_db
 
     # Find transitions from silence to sound
     threshold = np.max(rms_db) - 40
     is_silent = rms_db < threshold
 
     # Measure transition sharpness
-    transitions = np.diff(is_silent.astype(int))
-    onset_indices = np.where(transitions == -1)[0]  # silence → sound
-    offset_indices = np.where(transitions == 1)[0]  # sound → silence
-
-    sharp_onsets = 0
-    sharp_offsets = 0
+    onset_indices = np.flatnonzero(is_silent[:-1] & ~is_silent[1:])  # silence → sound
+    offset_indices = np.flatnonzero(~is_silent[:-1] & is_silent[1:])  # sound → silence
     total_transitions = len(onset_indices) + len(offset_indices)
 
-    for idx in onset_indices:
-        if idx > 0 and idx < len(rms_db) - 1:
-            jump = rms_db[idx + 1] - rms_db[idx]
-            if jump > 15:  # > 15dB in one frame = unnaturally sharp
-                sharp_onsets += 1
-
-    for idx in offset_indices:
-        if idx > 0 and idx < len(rms_db) - 1:
-            drop = rms_db[idx] - rms_db[idx + 1]
-            if drop > 15:
-                sharp_offsets += 1
+    # jumps[i] is the step from frame i to i + 1; > 15dB in one frame is
+    # unnaturally sharp. Transitions out of the very first frame don't count.
+    jumps = np.diff(rms_db)
+    sharp_onsets = int(np.count_nonzero(jumps[onset_indices[onset_indices > 0]] > 15))
+    sharp_offsets = int(np.count_nonzero(jumps[offset_indices[offset_indices > 0]] < -15))
 
     total_sharp = sharp_onsets + sharp_offsets
     result["params"]["total_transitions"] = total_transitions
@@ -1026,8 +1312,9 @@ def detect_noise_gate(y: Any, sr: int) -> Dict[str, Any]:
     return result
 
 
-def detect_delay(y: Any, sr: int) -> Dict[str, Any]:
+def detect_delay(ctx: FeatureCache) -> Dict[str, Any]:
     """Detect delay/echo via autocorrelation peaks."""
+    sr = ctx.sr
     result: Dict[str, Any] = {
         "effect": "delay_echo",
         "confidence": 0.0,
@@ -1036,22 +1323,20 @@ def detect_delay(y: Any, sr: int) -> Dict[str, Any]:
     }
 
     # Use energy envelope for autocorrelation (more robust than raw signal)
-    rms = _rms_envelope(y, frame_length=2048, hop_length=512)
-    rms_centered = rms - np.mean(rms)
-
-    if np.std(rms_centered) < 1e-10:
+    rms = ctx.rms
+    rms_mean, rms_std = _mean_std(rms)
+    if rms_std < 1e-10:
         return result
+    rms_centered = rms - rms_mean
 
-    autocorr = np.correlate(rms_centered, rms_centered, mode="full")
-    autocorr = autocorr[len(autocorr) // 2 :]
-    autocorr = autocorr / (autocorr[0] + 1e-10)
-
-    # Look for peaks in delay range (50ms - 1s)
+    # Look for peaks in delay range (50ms - 1s); only those lags are computed
     frames_per_sec = sr / 512
     min_delay_frames = int(0.05 * frames_per_sec)  # 50ms
     max_delay_frames = int(1.0 * frames_per_sec)  # 1s
 
-    search_region = autocorr[min_delay_frames : min(max_delay_frames, len(autocorr))]
+    energy = float(np.square(rms_centered, dtype=np.float64).sum())
+    search_region = _autocorr_range(rms_centered, min_delay_frames, max_delay_frames)
+    search_region /= energy + 1e-10
     if len(search_region) < 5:
         return result
 
@@ -1061,7 +1346,7 @@ def detect_delay(y: Any, sr: int) -> Dict[str, Any]:
         strongest_peak_idx = peaks_idx[np.argmax(search_region[peaks_idx])]
         actual_idx = strongest_peak_idx + min_delay_frames
         delay_seconds = actual_idx / frames_per_sec
-        peak_height = float(autocorr[actual_idx])
+        peak_height = float(search_region[strongest_peak_idx])
 
         result["params"]["delay_time_seconds"] = round(delay_seconds, 3)
         result["params"]["delay_time_ms"] = round(delay_seconds * 1000, 1)
@@ -1096,18 +1381,240 @@ def detect_delay(y: Any, sr: int) -> Dict[str, Any]:
 # Main analysis entry point
 # ---------------------------------------------------------------------------
 
+# (name, detector, requires_voice): detectors flagged True only make sense on
+# pitched vocal content and are skipped when no voice was detected.
+_DETECTORS = [
+    ("Reverb", detect_reverb, False),
+    ("Pitch shift", detect_pitch_shift, True),
+    ("Formant shift", detect_formant_shift, True),
+    ("Compression", detect_compression, False),
+    ("EQ/Filtering", detect_eq, False),
+    ("Distortion", detect_distortion, False),
+    ("Chorus/Doubling", detect_chorus, False),
+    ("Auto-tune", detect_autotune, True),
+    ("De-essing", detect_deessing, True),
+    ("Vocoder", detect_vocoder, True),
+    ("Noise gate", detect_noise_gate, False),
+    ("Delay/Echo", detect_delay, False),
+]
+
+
+def _init_worker() -> None:
+    """Process-pool initializer: one BLAS/OpenMP thread per worker.
+
+    The pool already runs one detector per core; letting each worker's BLAS
+    also spawn a thread per core oversubscribes the machine.
+    """
+    global _worker_limits
+    if threadpoolctl is not None:
+        _worker_limits = threadpoolctl.threadpool_limits(limits=1)
+
+
+_worker_limits = None
+
+
+def _dumps_result(result: Dict[str, Any]) -> bytes:
+    """Serialize an analysis result as indented JSON, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(result, indent=2).encode("utf-8")
+
+
+def _detector_error(name: str, error: Exception) -> Dict[str, Any]:
+    return {
+        "effect": name.lower().replace("/", "_").replace(" ", "_"),
+        "confidence": 0.0,
+        "params": {},
+        "evidence": [f"Error during analysis: {error}"],
+    }
+
+
+def _detector_skipped(
+    name: str, reason: str = "audio is silent or too short to analyze"
+) -> Dict[str, Any]:
+    return {
+        "effect": name.lower().replace("/", "_").replace(" ", "_"),
+        "confidence": 0.0,
+        "params": {},
+        "evidence": [f"Skipped: {reason}"],
+    }
+
+
+def _is_voice(f0_median: Optional[float]) -> bool:
+    """Whether a median F0 falls in the 50-600 Hz voice range."""
+    return f0_median is not None and 50 < f0_median < 600
+
+
+def _run_detector(name: str, detector_fn: Any, ctx: FeatureCache) -> Dict[str, Any]:
+    """Run one detector, turning any exception into a zero-confidence result."""
+    try:
+        with _fft_backend():
+            return detector_fn(ctx)
+    except Exception as e:
+        return _detector_error(name, e)
+
+
+def _voice_overview(ctx: FeatureCache) -> Tuple[Optional[float], Dict[str, float]]:
+    """Median F0 and the spectral profile; ``(None, {})`` for invalid audio."""
+    if not ctx.valid_audio:
+        return None, {}
+    with _fft_backend():
+        # Basic voice detection: check if there's pitched content in voice range
+        f0_median = _librosa_f0(ctx)
+        profile = {
+            "centroid_hz": round(float(np.mean(ctx.centroid)), 1),
+            "bandwidth_hz": round(float(np.mean(ctx.bandwidth)), 1),
+            "rolloff_hz": round(float(np.mean(ctx.rolloff)), 1),
+            "flatness": round(float(np.mean(ctx.flatness)), 4),
+        }
+    return f0_median, profile
+
+
+def _detect_effects(
+    ctx: FeatureCache,
+    pool: Optional[ProcessPoolExecutor] = None,
+    verbose: bool = True,
+    voice_detected: bool = True,
+) -> List[Dict[str, Any]]:
+    """Run every detector on ``ctx``, in ``pool`` if given, in ``_DETECTORS`` order.
+
+    Without a detected voice, the voice-only detectors return a skipped
+    result instead of running.
+    """
+    if not ctx.valid_audio:
+        return [_detector_skipped(name) for name, _, _ in _DETECTORS]
+    if pool is None:
+        effects = []
+        for name, detector_fn, requires_voice in _DETECTORS:
+            if requires_voice and not voice_detected:
+                effects.append(_detector_skipped(name, "no voice detected"))
+                continue
+            if verbose:
+                print(f"  Analyzing: {name}...")
+            effects.append(_run_detector(name, detector_fn, ctx))
+        return effects
+
+    # Compute the shared features once here so the workers receive them
+    # with the pickled cache instead of each redoing the STFTs.
+    with _fft_backend():
+        ctx.prefetch()
+    futures = []
+    for name, detector_fn, requires_voice in _DETECTORS:
+        if requires_voice and not voice_detected:
+            futures.append(None)
+            continue
+        if verbose:
+            print(f"  Analyzing: {name}...")
+        futures.append(pool.submit(_run_detector, name, detector_fn, ctx))
+    effects = []
+    for (name, _, _), future in zip(_DETECTORS, futures):
+        if future is None:
+            effects.append(_detector_skipped(name, "no voice detected"))
+            continue
+        try:
+            effects.append(future.result())
+        except Exception as e:
+            effects.append(_detector_error(name, e))
+    return effects
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_))
+
+
+def _analyze_windows(
+    y: Any, sr: int, pool: Optional[ProcessPoolExecutor] = None
+) -> Tuple[Optional[float], Dict[str, float], List[Dict[str, Any]]]:
+    """Analyze a long signal in overlapping windows and merge the results.
+
+    Only one window's features are alive at a time, so peak memory follows
+    the window length instead of the file length. Per detector, the window
+    with the highest energy-weighted confidence is picked, and its own
+    confidence, evidence and non-numeric params are reported; numeric params
+    are medians over the windows the detector ran on (voice-dependent
+    detectors skip unvoiced windows). F0 and the spectral profile are window
+    medians.
+    """
+    win = int(_WINDOW_SECONDS * sr)
+    step = win - int(_WINDOW_OVERLAP_SECONDS * sr)
+    starts = range(0, max(len(y) - win, 0) + step, step)
+    print(f"  Long input: analyzing {len(starts)} windows of {_WINDOW_SECONDS:.0f}s")
+
+    f0s: List[float] = []
+    profiles: List[Dict[str, float]] = []
+    spans: List[Tuple[float, float]] = []
+    energies: List[float] = []
+    voiced: List[bool] = []
+    per_window: List[List[Dict[str, Any]]] = []
+    for i, start in enumerate(starts):
+        ctx = FeatureCache(y[start : start + win], sr)
+        if not ctx.valid_audio:
+            continue
+        print(f"  Window {i + 1}/{len(starts)}...")
+        f0, profile = _voice_overview(ctx)
+        if f0 is not None:
+            f0s.append(f0)
+        profiles.append(profile)
+        spans.append((start / sr, min(start + win, len(y)) / sr))
+        energies.append(float(np.mean(np.square(ctx.y, dtype=np.float64))))
+        voiced.append(_is_voice(f0))
+        per_window.append(_detect_effects(ctx, pool, verbose=False, voice_detected=voiced[-1]))
+
+    if not per_window:
+        return None, {}, [_detector_skipped(name) for name, _, _ in _DETECTORS]
+
+    weights = np.asarray(energies) / max(energies)
+    effects = []
+    for d, (_, _, requires_voice) in enumerate(_DETECTORS):
+        # Voice-gated windows only hold a skip stub for this detector.
+        ran = [i for i in range(len(per_window)) if voiced[i] or not requires_voice]
+        if not ran:
+            effects.append(per_window[0][d])
+            continue
+        results = [per_window[i][d] for i in ran]
+        scores = [r.get("confidence", 0.0) * weights[i] for r, i in zip(results, ran)]
+        best = ran[int(np.argmax(scores))]
+        merged = dict(per_window[best][d])
+        params = dict(merged.get("params", {}))
+        for key, value in params.items():
+            values = [r["params"][key] for r in results if _is_number(r["params"].get(key))]
+            if _is_number(value) and values:
+                median = float(np.median(values))
+                params[key] = round(median) if isinstance(value, int) else median
+        start, end = spans[best]
+        merged["params"] = params
+        merged["evidence"] = list(merged.get("evidence", [])) + [
+            f"Strongest in {start:.0f}-{end:.0f}s of {len(ran)} windows"
+        ]
+        effects.append(merged)
+
+    profile = {key: float(np.median([p[key] for p in profiles])) for key in profiles[0]}
+    f0_median = float(np.median(f0s)) if f0s else None
+    return f0_median, profile, effects
+
 
 def analyze_voice(
     path: Path,
     export_json: bool = False,
     output_dir: Optional[Path] = None,
+    workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
     """Analyze a voice audio file for applied effects and processing.
 
+    Inputs longer than ``_LONG_AUDIO_SECONDS`` are analyzed in overlapping
+    windows and merged (see :func:`_analyze_windows`).
+
     Args:
         path: Path to audio file.
         export_json: If True, export results to JSON.
         output_dir: Directory for JSON output (default: same as audio file).
+        workers: Detector processes to run in parallel; None uses the CPU
+            count and 1 runs them in this process.
 
     Returns:
         Dict with full analysis results including detected effects.
@@ -1122,12 +1629,32 @@ def analyze_voice(
 
     print(f"  Duration: {duration:.1f}s | Sample rate: {sr}Hz")
     print(
-        f"  Dependencies: librosa=YES, parselmouth={'YES' if _HAS_PARSELMOUTH else 'NO'}, crepe={'YES' if _HAS_CREPE else 'NO'}"
+        f"  Dependencies: librosa=YES, parselmouth={'YES' if _HAS_PARSELMOUTH else 'NO'}, "
+        f"crepe={'YES' if _HAS_CREPE else 'NO'}, pyfftw={'YES' if _USE_FFTW else 'NO'}"
     )
 
-    # Basic voice detection: check if there's pitched content in voice range
-    f0_median = _librosa_f0(y, sr)
-    voice_detected = f0_median is not None and 50 < f0_median < 600
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=min(workers, len(_DETECTORS)), initializer=_init_worker
+        )
+        if workers > 1
+        else contextlib.nullcontext()
+    )
+
+    with executor as pool:
+        if duration > _LONG_AUDIO_SECONDS:
+            f0_median, profile, effects = _analyze_windows(y, sr, pool)
+        else:
+            # One feature cache shared by voice detection, the spectral
+            # profile and every detector
+            ctx = FeatureCache(y, sr)
+            if not ctx.valid_audio:
+                print("  Audio is silent or too short; skipping analysis")
+            f0_median, profile = _voice_overview(ctx)
+            effects = _detect_effects(ctx, pool, voice_detected=_is_voice(f0_median))
+    voice_detected = _is_voice(f0_median)
 
     result: Dict[str, Any] = {
         "file": str(path),
@@ -1140,54 +1667,14 @@ def analyze_voice(
             "librosa": True,
             "parselmouth": _HAS_PARSELMOUTH,
             "crepe": _HAS_CREPE,
+            "pyfftw": _USE_FFTW,
         },
-        "effects_detected": [],
-        "spectral_profile": {},
+        "effects_detected": effects,
+        "spectral_profile": profile,
     }
 
-    # Spectral profile
-    spectral_centroid = float(np.mean(librosa.feature.spectral_centroid(y=y, sr=sr)))
-    spectral_bandwidth = float(np.mean(librosa.feature.spectral_bandwidth(y=y, sr=sr)))
-    spectral_rolloff = float(np.mean(librosa.feature.spectral_rolloff(y=y, sr=sr)))
-    spectral_flatness = float(np.mean(librosa.feature.spectral_flatness(y=y)))
-
-    result["spectral_profile"] = {
-        "centroid_hz": round(spectral_centroid, 1),
-        "bandwidth_hz": round(spectral_bandwidth, 1),
-        "rolloff_hz": round(spectral_rolloff, 1),
-        "flatness": round(spectral_flatness, 4),
-    }
-
-    # Run all detectors
-    detectors = [
-        ("Reverb", detect_reverb),
-        ("Pitch shift", detect_pitch_shift),
-        ("Formant shift", detect_formant_shift),
-        ("Compression", detect_compression),
-        ("EQ/Filtering", detect_eq),
-        ("Distortion", detect_distortion),
-        ("Chorus/Doubling", detect_chorus),
-        ("Auto-tune", detect_autotune),
-        ("De-essing", detect_deessing),
-        ("Vocoder", detect_vocoder),
-        ("Noise gate", detect_noise_gate),
-        ("Delay/Echo", detect_delay),
-    ]
-
-    for name, detector_fn in detectors:
-        print(f"  Analyzing: {name}...")
-        try:
-            effect_result = detector_fn(y, sr)
-            result["effects_detected"].append(effect_result)
-        except Exception as e:
-            result["effects_detected"].append(
-                {
-                    "effect": name.lower().replace("/", "_").replace(" ", "_"),
-                    "confidence": 0.0,
-                    "params": {},
-                    "evidence": [f"Error during analysis: {e}"],
-                }
-            )
+    if _USE_FFTW:
+        _save_fftw_wisdom()
 
     # Sort by confidence descending
     result["effects_detected"].sort(key=lambda x: x.get("confidence", 0), reverse=True)
@@ -1198,13 +1685,75 @@ def analyze_voice(
             output_dir = path.parent
         output_dir.mkdir(parents=True, exist_ok=True)
         json_path = output_dir / f"{path.stem}_voice_analysis.json"
-        with json_path.open("w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2)
+        json_path.write_bytes(_dumps_result(result))
         print(f"\nAnalysis saved to {json_path}")
 
     return result
 
 
+def _warmup() -> None:
+    """Batch-pool initializer: thread limits plus a full pass on a short tone.
+
+    Compiles librosa's numba kernels (pyin's Viterbi, the spectral features)
+    and builds the cached filter banks once per worker, before its first
+    real file rather than during it.
+    """
+    _init_worker()
+    sr = 22050
+    t = np.arange(sr, dtype=np.float32) / sr
+    ctx = FeatureCache(0.2 * np.sin(2 * np.pi * 180.0 * t, dtype=np.float32), sr)
+    _voice_overview(ctx)
+    _detect_effects(ctx, verbose=False)
+
+
+def _analyze_voice_safe(path: Path, **kwargs: Any) -> Dict[str, Any]:
+    """Run :func:`analyze_voice`, returning an error record instead of raising.
+
+    Top-level so it can be pickled into worker processes; one unreadable file
+    must not abort the rest of the batch.
+    """
+    try:
+        return analyze_voice(path, **kwargs)
+    except Exception as e:
+        return {"file": str(path), "error": str(e)}
+
+
+def analyze_voice_batch(
+    paths: List[Path],
+    workers: Optional[int] = None,
+    export_json: bool = False,
+    output_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Analyze many voice files, one file per worker process.
+
+    Each worker is warmed up once (see :func:`_warmup`) and then runs its
+    files' detectors serially, so JIT compilation is paid per worker rather
+    than per file.
+
+    Args:
+        paths: Audio files to analyze.
+        workers: Worker processes (default: CPU count). 1 runs in-process.
+        export_json: If True, export each result to JSON.
+        output_dir: Directory for JSON output (default: next to each file).
+
+    Returns:
+        One result dict per path, in order; unreadable files yield an
+        ``{"file", "error"}`` record.
+    """
+    _require_librosa()
+    paths = [Path(p) for p in paths]
+    analyze = partial(
+        _analyze_voice_safe, export_json=export_json, output_dir=output_dir, workers=1
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    if workers == 1:
+        return [analyze(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warmup) as pool:
+        return list(pool.map(analyze, paths))
+
+
 def print_voice_summary(result: Dict[str, Any]) -> None:
     """Print a human-readable summary of voice effects analysis."""
     print("\n" + "=" * 60)
@@ -1,10 +1,16 @@
 """YouTube scraping adapter.
 
 Uses yt-dlp as a Python library for search and metadata extraction.
+Search results and video metadata are memoized per process (see
+:func:`clear_cache`), so the summarizer's helpers can look up the same URL
+without repeating the network round trip.
 """
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -23,6 +29,18 @@ def _check_ytdlp() -> None:
         )
 
 
+def _normalize_url(video_id_or_url: str) -> str:
+    if not video_id_or_url.startswith("http"):
+        return f"https://www.youtube.com/watch?v={video_id_or_url}"
+    return video_id_or_url
+
+
+def clear_cache() -> None:
+    """Forget memoized :func:`search` and :func:`get_info` results."""
+    _search.cache_clear()
+    _get_info.cache_clear()
+
+
 def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Search YouTube for videos matching query.
 
@@ -34,6 +52,23 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
         List of dicts with id, title, channel, duration, url.
     """
     _check_ytdlp()
+    # Callers own the returned dicts; keep the cached copy pristine.
+    return copy.deepcopy(_search(query, limit))
+
+
+def _slim_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields :func:`search` returns from a flat search entry."""
+    return {
+        "id": entry.get("id"),
+        "title": entry.get("title"),
+        "channel": entry.get("channel") or entry.get("uploader"),
+        "duration": entry.get("duration"),
+        "url": f"https://www.youtube.com/watch?v={entry.get('id')}",
+    }
+
+
+@lru_cache(maxsize=256)
+def _search(query: str, limit: int) -> List[Dict[str, Any]]:
     search_url = f"ytsearch{limit}:{query}"
 
     ydl_opts = {
@@ -41,28 +76,16 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
         "no_warnings": True,
         "extract_flat": True,
         "skip_download": True,
+        # Stop extracting once ``limit`` entries are in, and hand them over
+        # lazily so each full entry can be dropped as soon as it is slimmed.
+        "playlistend": limit,
+        "lazy_playlist": True,
     }
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         result = ydl.extract_info(search_url, download=False)
-
-    videos: List[Dict[str, Any]] = []
-    entries = result.get("entries", []) if result else []
-
-    for entry in entries:
-        if not entry:
-            continue
-        videos.append(
-            {
-                "id": entry.get("id"),
-                "title": entry.get("title"),
-                "channel": entry.get("channel") or entry.get("uploader"),
-                "duration": entry.get("duration"),
-                "url": f"https://www.youtube.com/watch?v={entry.get('id')}",
-            }
-        )
-
-    return videos
+        entries = (result.get("entries") or ()) if result else ()
+        return [_slim_entry(entry) for entry in islice(entries, limit) if entry]
 
 
 def get_info(video_id_or_url: str) -> Dict[str, Any]:
@@ -75,13 +98,11 @@ def get_info(video_id_or_url: str) -> Dict[str, Any]:
         Dict with title, channel, duration, description, tags, etc.
     """
     _check_ytdlp()
+    return copy.deepcopy(_get_info(_normalize_url(video_id_or_url)))
 
-    # Normalize to URL
-    if not video_id_or_url.startswith("http"):
-        url = f"https://www.youtube.com/watch?v={video_id_or_url}"
-    else:
-        url = video_id_or_url
 
+@lru_cache(maxsize=256)
+def _get_info(url: str) -> Dict[str, Any]:
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
@@ -120,11 +141,7 @@ def download_audio(
         Path to downloaded audio file.
     """
     _check_ytdlp()
-
-    if not video_id_or_url.startswith("http"):
-        url = f"https://www.youtube.com/watch?v={video_id_or_url}"
-    else:
-        url = video_id_or_url
+    url = _normalize_url(video_id_or_url)
 
     output_dir.mkdir(parents=True, exist_ok=True)
     output_template = str(output_dir / "%(title)s.%(ext)s")
@@ -143,10 +160,12 @@ def download_audio(
     }
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([url])
+        info = ydl.extract_info(url, download=True)
+        # The template-expanded name of this download; the audio extractor
+        # keeps the stem and swaps in the target codec's extension.
+        downloaded = Path(ydl.prepare_filename(info)).with_suffix(f".{format}")
 
-    # Find the downloaded file
-    for f in output_dir.glob(f"*.{format}"):
-        return f
+    if downloaded.exists():
+        return downloaded
 
     raise RuntimeError("Download succeeded but output file not found")
@@ -5,10 +5,80 @@ Extracts metadata and description to generate Suno-ready prompts.
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import Any, Dict, Optional
 
 from . import yt_scraper_adapter
 
+# Keyword vocabularies for extract_music_keywords, matched as substrings of
+# the lower-cased title, description and tags.
+_GENRES = (
+    "pop",
+    "rock",
+    "hip hop",
+    "rap",
+    "electronic",
+    "edm",
+    "house",
+    "techno",
+    "jazz",
+    "blues",
+    "classical",
+    "country",
+    "folk",
+    "metal",
+    "punk",
+    "indie",
+    "r&b",
+    "soul",
+    "reggae",
+    "latin",
+    "ambient",
+    "lo-fi",
+    "lofi",
+    "trap",
+    "dubstep",
+    "drum and bass",
+    "dnb",
+    "hardcore",
+    "hardstyle",
+    "trance",
+)
+
+_MOODS = (
+    "happy",
+    "sad",
+    "energetic",
+    "calm",
+    "dark",
+    "bright",
+    "melancholic",
+    "upbeat",
+    "chill",
+    "aggressive",
+    "peaceful",
+    "epic",
+    "dreamy",
+    "intense",
+)
+
+_INSTRUMENTS = (
+    "guitar",
+    "piano",
+    "drums",
+    "bass",
+    "synth",
+    "violin",
+    "saxophone",
+    "trumpet",
+    "flute",
+    "vocal",
+    "vocals",
+    "808",
+    "strings",
+    "orchestra",
+)
+
 
 def get_video_context(url: str) -> Dict[str, Any]:
     """Get video metadata useful for summarization.
@@ -83,86 +153,17 @@ def extract_music_keywords(url: str) -> Dict[str, Any]:
     description = (info.get("description") or "").lower()
     tags = [t.lower() for t in (info.get("tags") or [])]
 
-    # Common genre keywords
-    genres = [
-        "pop",
-        "rock",
-        "hip hop",
-        "rap",
-        "electronic",
-        "edm",
-        "house",
-        "techno",
-        "jazz",
-        "blues",
-        "classical",
-        "country",
-        "folk",
-        "metal",
-        "punk",
-        "indie",
-        "r&b",
-        "soul",
-        "reggae",
-        "latin",
-        "ambient",
-        "lo-fi",
-        "lofi",
-        "trap",
-        "dubstep",
-        "drum and bass",
-        "dnb",
-        "hardcore",
-        "hardstyle",
-        "trance",
-    ]
-
-    # Mood keywords
-    moods = [
-        "happy",
-        "sad",
-        "energetic",
-        "calm",
-        "dark",
-        "bright",
-        "melancholic",
-        "upbeat",
-        "chill",
-        "aggressive",
-        "peaceful",
-        "epic",
-        "dreamy",
-        "intense",
-    ]
-
-    # Instrument keywords
-    instruments = [
-        "guitar",
-        "piano",
-        "drums",
-        "bass",
-        "synth",
-        "violin",
-        "saxophone",
-        "trumpet",
-        "flute",
-        "vocal",
-        "vocals",
-        "808",
-        "strings",
-        "orchestra",
-    ]
-
     combined_text = f"{title} {description} {' '.join(tags)}"
 
-    found_genres = [g for g in genres if g in combined_text]
-    found_moods = [m for m in moods if m in combined_text]
-    found_instruments = [i for i in instruments if i in combined_text]
+    # Stop scanning a vocabulary once enough hints are found
+    found_genres = list(islice((g for g in _GENRES if g in combined_text), 5))
+    found_moods = list(islice((m for m in _MOODS if m in combined_text), 3))
+    found_instruments = list(islice((i for i in _INSTRUMENTS if i in combined_text), 5))
 
     return {
-        "genre_hints": found_genres[:5],
-        "mood_hints": found_moods[:3],
-        "instrument_hints": found_instruments[:5],
+        "genre_hints": found_genres,
+        "mood_hints": found_moods,
+        "instrument_hints": found_instruments,
         "tags": tags[:10],
         "title": info.get("title"),
     }